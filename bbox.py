@@ -1,6 +1,14 @@
 # Add GUI for creating BoundingBox for mesh(es)
 
-import bpy, bmesh, re
+import bpy, bmesh, re, os, mmap, ctypes, functools
+import argparse, csv, glob, json, subprocess, sys, time
+import gpu
+import numpy as np
+from gpu_extras.batch import batch_for_shader
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from bpy.app.handlers import persistent
 from bpy.types import MeshVertices
 from mathutils import Vector, Matrix, Euler
 
@@ -11,6 +19,173 @@ vec_one.freeze()
 rot_zero = Euler((0.0,0.0,0.0))
 rot_zero.freeze()
 
+# Topology of box from v_shuffles corners (index = x*4 + y*2 + z, 0 - min, 1 - max)
+bbox_edges = (
+    (0, 1), (2, 3), (4, 5), (6, 7), # Z
+    (0, 2), (1, 3), (4, 6), (5, 7), # Y
+    (0, 4), (1, 5), (2, 6), (3, 7), # X
+)
+bbox_faces = (
+    (0, 1, 3, 2), (4, 6, 7, 5), # -X, +X
+    (0, 4, 5, 1), (2, 3, 7, 6), # -Y, +Y
+    (0, 2, 6, 4), (1, 5, 7, 3), # -Z, +Z
+)
+
+def mesh_fingerprint(mesh, samples=64):
+    """
+    Get cheap geometry fingerprint of mesh: element counts and sampled vertex positions
+    """
+    vertices = mesh.vertices
+    n = len(vertices)
+    step = max(1, n // samples)
+    return (n, len(mesh.edges), len(mesh.polygons),
+        hash(tuple(c for i in range(0, n, step) for c in vertices[i].co)))
+
+class MeshCache:
+    """
+    LRU cache of per-mesh results. Entry is valid while mesh fingerprint is
+    unchanged and mesh geometry was not updated by depsgraph
+    """
+    def __init__(self, size):
+        self.size = size
+        self.items = OrderedDict()
+        self.dirty = set()
+    
+    def get(self, mesh):
+        key = mesh.as_pointer()
+        item = self.items.get(key)
+        if item is None:
+            return None
+        if key in self.dirty or item[0] != mesh_fingerprint(mesh):
+            self.discard(key)
+            return None
+        self.items.move_to_end(key)
+        return item[1]
+    
+    def set(self, mesh, value):
+        key = mesh.as_pointer()
+        self.items[key] = (mesh_fingerprint(mesh), value)
+        self.items.move_to_end(key)
+        self.dirty.discard(key)
+        while len(self.items) > self.size:
+            self.dirty.discard(self.items.popitem(last=False)[0])
+    
+    def discard(self, key):
+        self.items.pop(key, None)
+        self.dirty.discard(key)
+    
+    def mark_dirty(self, key):
+        if key in self.items:
+            self.dirty.add(key)
+    
+    def clear(self):
+        self.items.clear()
+        self.dirty.clear()
+
+# Diagonal points of meshes bounding boxes
+bbox_cache = MeshCache(1024)
+# Convex hull points of meshes, (N, 3) arrays
+hull_cache = MeshCache(256)
+# Skip own updates in depsgraph handler
+bbox_updating = False
+
+@persistent
+def bbox_depsgraph_update(scene, depsgraph):
+    """
+    Mark cached results of meshes with updated geometry as dirty
+    """
+    global live_batch
+    if live_handle is not None:
+        live_batch = None
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+                live_dirty.add(update.id.original.as_pointer())
+    if bbox_updating:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        # Original mesh and evaluated mesh (with modifiers)
+        for id_data in (update.id.original, update.id):
+            if isinstance(id_data, bpy.types.Object):
+                id_data = id_data.data
+            if isinstance(id_data, bpy.types.Mesh):
+                key = id_data.as_pointer()
+                bbox_cache.mark_dirty(key)
+                hull_cache.mark_dirty(key)
+
+@persistent
+def bbox_load_post(*args):
+    """
+    Clear caches on file loading
+    """
+    bbox_cache.clear()
+    hull_cache.clear()
+    live_extents.clear()
+    live_dirty.clear()
+    live_enable(any(scene.bbox_props.bbox_live for scene in bpy.data.scenes))
+
+class BBoxStats:
+    """
+    Per-stage timings and counters of bbox pipeline, per object and in total
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.total = {} # {stage: [seconds, calls]}
+        self.objects = {} # {object name: {stage: seconds}}
+    
+    @contextmanager
+    def stage(self, name, obj=None):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            sec = time.perf_counter() - start
+            total = self.total.setdefault(name, [0.0, 0])
+            total[0] += sec
+            total[1] += 1
+            if obj is not None:
+                stages = self.objects.setdefault(obj.name, {})
+                stages[name] = stages.get(name, 0.0) + sec
+    
+    def summary(self):
+        """
+        Get one line summary of stages
+        """
+        return ", ".join("%s %.3fs" % (name, sec) for name, (sec, calls) in self.total.items())
+    
+    def report_lines(self, top=10):
+        """
+        Get report lines: stages in total and slowest objects
+        """
+        lines = ["[BBOX] Timing: %.3fs in total, %i object(s)" % (
+            sum(sec for sec, calls in self.total.values()), len(self.objects))]
+        for name, (sec, calls) in sorted(self.total.items(), key=lambda e: -e[1][0]):
+            lines.append("  %-12s %9.4fs  %6i call(s)" % (name, sec, calls))
+        slowest = sorted(self.objects.items(), key=lambda e: -sum(e[1].values()))[:top]
+        if slowest:
+            lines.append("  Slowest objects:")
+        for name, stages in slowest:
+            lines.append("  %-24s %9.4fs  (%s)" % (name, sum(stages.values()),
+                ", ".join("%s %.4fs" % e for e in sorted(stages.items(), key=lambda e: -e[1]))))
+        return lines
+    
+    def dump(self, path):
+        """
+        Write stats to JSON file
+        """
+        with open(path, "w") as f:
+            json.dump({
+                "total": {name: {"time": sec, "calls": calls} for name, (sec, calls) in self.total.items()},
+                "objects": self.objects,
+            }, f, indent=2)
+
+# Used when stats are not requested
+no_stats = BBoxStats(enabled=False)
+
 # Convert list of verticles to list of Vector
 def vtx_to_vec(vtx):
     """
@@ -22,6 +197,74 @@ def vtx_to_vec(vtx):
         return vtx.co
     raise TypeError("ONLY VERTEXT OR VERTICES")
     
+def vtx_to_array(vtx):
+    """
+    Read MeshVertices positions to (N, 3) float32 array with one foreach_get call
+    """
+    co = np.empty(len(vtx) * 3, dtype=np.float32)
+    vtx.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+def arr_min_max(co):
+    """
+    Get 2 points defining the diagonal of the bounding box from (N, 3) array
+    """
+    return Vector(co.min(axis=0).tolist()), Vector(co.max(axis=0).tolist())
+
+def chunks_min_max(chunks):
+    """
+    Get 2 points defining the diagonal of the bounding box from iterable of (N, 3) arrays
+    """
+    lo, hi = None, None
+    for co in chunks:
+        if len(co) == 0:
+            continue
+        co = co.astype(np.float32, copy=False)
+        lo = co.min(axis=0) if lo is None else np.minimum(lo, co.min(axis=0))
+        hi = co.max(axis=0) if hi is None else np.maximum(hi, co.max(axis=0))
+    if lo is None:
+        raise ValueError("No vertices")
+    return Vector(lo.tolist()), Vector(hi.tolist())
+
+def vtx_view(vertx):
+    """
+    Get read-only (N, 3) float32 view of MeshVertices positions in Blender memory
+    (no copy) or None if memory layout is not recognized. Valid until mesh is changed
+    """
+    n = len(vertx)
+    if n < 2:
+        return None
+    ptr = vertx[0].as_pointer()
+    stride = vertx[1].as_pointer() - ptr
+    if stride < 12 or stride % 4 != 0 or ptr == 0:
+        return None
+    # Addresses are checked first (no memory reading), then values
+    samples = (0, 1, n // 4, n // 2, 3 * n // 4, n - 1)
+    for i in samples:
+        if vertx[i].as_pointer() != ptr + i * stride:
+            return None
+    buf = (ctypes.c_char * (stride * (n - 1) + 12)).from_address(ptr)
+    view = np.lib.stride_tricks.as_strided(np.frombuffer(buf, dtype=np.float32),
+        shape=(n, 3), strides=(stride, 4), writeable=False)
+    for i in samples:
+        if tuple(view[i].tolist()) != tuple(vertx[i].co):
+            return None
+    return view
+
+def vtx_chunks(vertx, chunk, matrix=None):
+    """
+    Yield (chunk, 3) windows of MeshVertices positions (transformed copies with matrix).
+    Without known memory layout whole buffer is read by foreach_get (memory is not bounded)
+    """
+    view = vtx_view(vertx)
+    if view is None:
+        print("[BBOX] Unknown vertex memory layout of mesh '%s', chunk size is ignored (whole mesh is read)"
+            % vertx.id_data.name)
+        co = vtx_to_array(vertx)
+        yield co if matrix is None else arr_transform(co, matrix)
+        return
+    for i in range(0, len(view), chunk):
+        yield view[i:i+chunk] if matrix is None else arr_transform(view[i:i+chunk].copy(), matrix)
 
 def v_min_max(vecs):
     """
@@ -46,11 +289,52 @@ def v_shuffles(vecs):
                 res.append(Vector((x, y, z)))
     return res
 
-def get_bbox(vertx):
+def is_axis_aligned(matrix, eps=1e-6):
     """
-    Get bounding box data: corners, size, origin
+    Check if matrix only scales/flips/swaps axes (AABB corners stay AABB corners)
+    """
+    for row in range(3):
+        if sum(1 for col in range(3) if abs(matrix[row][col]) > eps) > 1:
+            return False
+    return True
+
+def arr_transform(co, matrix, chunk=65536):
+    """
+    Apply matrix to (N, 3) array in place, chunk by chunk
+    """
+    m = np.array(matrix, dtype=np.float32)
+    rot = m[:3, :3].T.copy()
+    loc = m[:3, 3].copy()
+    for i in range(0, len(co), chunk):
+        part = co[i:i+chunk]
+        part[:] = part @ rot + loc
+    return co
+
+def corners_min_max(diag, matrix):
+    """
+    Get diagonal of the bounding box of 8 corners (from diagonal points) transformed by matrix
+    """
+    return v_min_max([matrix @ v for v in v_shuffles(diag)])
+
+def world_min_max(vertx, matrix, chunk=0):
+    """
+    Get 2 points defining the diagonal of the bounding box of vertices transformed by matrix.
+    With chunk > 0 positions are read in windows of chunk vertices
+    """
+    if is_axis_aligned(matrix):
+        # Only 8 corners are needed when transform keeps box axis-aligned
+        return corners_min_max(get_min_max(vertx, chunk), matrix)
+    # Extreme points of transformed mesh are on its convex hull
+    co = hull_cache.get(vertx.id_data)
+    if co is None and 0 < chunk < len(vertx):
+        return chunks_min_max(vtx_chunks(vertx, chunk, matrix))
+    co = vtx_to_array(vertx) if co is None else co.copy()
+    return arr_min_max(arr_transform(co, matrix))
+
+def bbox_from_min_max(v1, v2):
+    """
+    Get bounding box data (corners, size, origin) from diagonal points
     """
-    v1, v2 = v_min_max(vtx_to_vec(vertx))
     size = Vector((
         abs(v2.x - v1.x),
         abs(v2.y - v1.y),
@@ -59,6 +343,202 @@ def get_bbox(vertx):
     origin = Vector(( (v2.x+v1.x)/2.0 , (v2.y+v1.y)/2.0, v1.z ))
     return v_shuffles((v1, v2)), size, origin
 
+def get_min_max(vertx, chunk=0):
+    """
+    Get 2 points defining the diagonal of the bounding box, cached per mesh.
+    With chunk > 0 positions are reduced in windows of chunk vertices
+    """
+    mesh = vertx.id_data
+    diag = bbox_cache.get(mesh)
+    if diag is None:
+        if 0 < chunk < len(vertx):
+            diag = chunks_min_max(vtx_chunks(vertx, chunk))
+        else:
+            diag = arr_min_max(vtx_to_array(vertx))
+        bbox_cache.set(mesh, diag)
+    return diag
+
+def get_bbox(vertx, chunk=0):
+    """
+    Get bounding box data: corners, size, origin
+    """
+    return bbox_from_min_max(*get_min_max(vertx, chunk))
+
+def hull_2d(pts, directions=32):
+    """
+    Get convex hull (counter-clockwise) of (N, 2) array
+    """
+    pts = np.asarray(pts, dtype=np.float64)
+    if len(pts) > 4 * directions:
+        # Drop points strictly inside polygon of extreme points (Akl-Toussaint)
+        angles = np.linspace(0.0, 2.0 * np.pi, directions, endpoint=False)
+        ids = [int(np.argmax(pts @ np.array((np.cos(a), np.sin(a))))) for a in angles]
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > 2:
+            poly = pts[ids]
+            keep = np.zeros(len(pts), dtype=bool)
+            for a, b in zip(poly, np.roll(poly, -1, axis=0)):
+                keep |= (b[0]-a[0]) * (pts[:, 1]-a[1]) - (b[1]-a[1]) * (pts[:, 0]-a[0]) <= 0.0
+            pts = pts[keep]
+    pts = np.unique(pts, axis=0)
+    if len(pts) < 3:
+        return pts
+    # Andrew's monotone chain
+    def half(points):
+        res = []
+        for p in points:
+            while len(res) > 1 and ((res[-1][0]-res[-2][0]) * (p[1]-res[-2][1])
+                                   - (res[-1][1]-res[-2][1]) * (p[0]-res[-2][0])) <= 0.0:
+                res.pop()
+            res.append(p)
+        return res
+    points = pts.tolist()
+    lower = half(points)
+    upper = half(reversed(points))
+    return np.array(lower[:-1] + upper[:-1])
+
+def min_area_rect(hull):
+    """
+    Get angle and area of minimal area rectangle around 2D convex hull (rotating calipers)
+    """
+    if len(hull) < 3:
+        return 0.0, 0.0
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2.0))
+    cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+    xs = hull[:, 0] * cos + hull[:, 1] * sin
+    ys = hull[:, 1] * cos - hull[:, 0] * sin
+    areas = (xs.max(axis=1) - xs.min(axis=1)) * (ys.max(axis=1) - ys.min(axis=1))
+    i = int(np.argmin(areas))
+    return float(angles[i]), float(areas[i])
+
+def obb_axes(co, refine=True):
+    """
+    Get rotation (box axes as columns) of oriented bounding box of (N, 3) array.
+    Axes are estimated by PCA and optionally refined by rotating calipers on
+    convex hull of points projected along each axis
+    """
+    if len(co) < 2:
+        return np.identity(3)
+    cov = np.cov(co, rowvar=False)
+    if not np.all(np.isfinite(cov)):
+        # Degenerate input, box is AABB
+        return np.identity(3)
+    axes = np.linalg.eigh(cov)[1][:, ::-1].copy()
+    # Box Z is the axis closest to world Z, pointing up
+    up = int(np.argmax(np.abs(axes[2])))
+    axes = axes[:, [i for i in range(3) if i != up] + [up]]
+    if axes[2, 2] < 0.0:
+        axes[:, 2] *= -1.0
+    if np.linalg.det(axes) < 0.0:
+        axes[:, 0] *= -1.0
+    if not refine:
+        return axes
+    best, best_vol = axes, np.inf
+    for k in range(3):
+        u, v = axes[:, (k+1) % 3], axes[:, (k+2) % 3]
+        angle, area = min_area_rect(hull_2d(np.stack((co @ u, co @ v), axis=1)))
+        d = co @ axes[:, k]
+        vol = area * float(d.max() - d.min())
+        if vol < best_vol:
+            res = axes.copy()
+            res[:, (k+1) % 3] = u * np.cos(angle) + v * np.sin(angle)
+            res[:, (k+2) % 3] = v * np.cos(angle) - u * np.sin(angle)
+            best, best_vol = res, vol
+    return best
+
+def get_obb(co, refine=True):
+    """
+    Get oriented bounding box data of (N, 3) array: corners, size, origin, rotation
+    """
+    axes = obb_axes(co, refine)
+    rot = Matrix(axes.tolist())
+    corners, size, origin = bbox_from_min_max(*arr_min_max(co @ axes.astype(np.float32)))
+    return [rot @ v for v in corners], size, rot @ origin, rot
+
+def hull_points(co):
+    """
+    Reduce (N, 3) array to vertices of its convex hull
+    """
+    if len(co) < 8:
+        return co.copy()
+    # Drop points strictly inside hull of extreme points in 26 directions (Akl-Toussaint)
+    dirs = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)
+        if (x, y, z) != (0, 0, 0)], dtype=np.float32)
+    extreme = co[np.unique([np.argmax(co @ d) for d in dirs])]
+    eps = 1e-6 * float(np.abs(extreme).max() + 1.0)
+    bm = bmesh.new()
+    for p in extreme:
+        bm.verts.new(p.tolist())
+    bmesh.ops.convex_hull(bm, input=bm.verts[:])
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
+    planes = [(np.array(f.normal, dtype=np.float32), f.normal.dot(f.verts[0].co)) for f in bm.faces]
+    bm.free()
+    if len(planes) > 3:
+        keep = np.zeros(len(co), dtype=bool)
+        for normal, dist in planes:
+            keep |= co @ normal >= dist - eps
+        co = co[keep]
+    # Exact hull of remaining points, loaded to bmesh through temporary mesh (no Python loop)
+    tmp = bpy.data.meshes.new("~BBOX_HULL")
+    tmp.vertices.add(len(co))
+    tmp.vertices.foreach_set("co", co.ravel())
+    bm = bmesh.new()
+    bm.from_mesh(tmp)
+    bpy.data.meshes.remove(tmp)
+    res = bmesh.ops.convex_hull(bm, input=bm.verts[:])
+    hull = [v.co[:] for v in res["geom"] if isinstance(v, bmesh.types.BMVert)]
+    bm.free()
+    # Flat or degenerate geometry has no 3D hull
+    if len(hull) < 4:
+        return hull_flat(co)
+    return np.array(hull, dtype=np.float32)
+
+def hull_flat(co):
+    """
+    Reduce flat (N, 3) array to its points on convex hull in best-fit plane
+    and extreme points along plane normal
+    """
+    center = co.mean(axis=0, dtype=np.float64)
+    axes = np.linalg.eigh(np.cov(co, rowvar=False))[1]
+    normal, plane = axes[:, 0], axes[:, 1:]
+    uv = (co - center) @ plane
+    hull = hull_2d(uv)
+    keep = np.isin(uv[:, 0] + 1j * uv[:, 1], hull[:, 0] + 1j * hull[:, 1])
+    dist = (co - center) @ normal
+    keep[np.argmin(dist)] = True
+    keep[np.argmax(dist)] = True
+    return co[keep]
+
+def get_hull(mesh):
+    """
+    Get convex hull points of mesh, calculated once per mesh geometry
+    """
+    hull = hull_cache.get(mesh)
+    if hull is None:
+        hull = hull_points(vtx_to_array(mesh.vertices))
+        hull_cache.set(mesh, hull)
+    return hull
+
+def mesh_transform(mesh, matrix, diag=None):
+    """
+    Transform mesh and keep its cached convex hull and bounding box valid.
+    diag - already known bounding box diagonal of transformed mesh
+    """
+    if matrix == Matrix.Identity(4):
+        return
+    hull = hull_cache.get(mesh)
+    if diag is None:
+        diag = bbox_cache.get(mesh)
+        diag = corners_min_max(diag, matrix) if diag is not None and is_axis_aligned(matrix) else None
+    mesh.transform(matrix)
+    if hull is not None:
+        hull = arr_transform(hull, matrix)
+        hull_cache.set(mesh, hull)
+        diag = arr_min_max(hull) if diag is None else diag
+    if diag is not None:
+        bbox_cache.set(mesh, diag)
+
 def approx(test, values, appr=0.000001):
     """
     Check if the value is approximated by other values
@@ -88,63 +568,236 @@ def mesh_buildpoly(_obj):
     bpy.context.area.type = previous_context
 
 
-def get_object_bb(obj, prefix: str="BBOX", create_bbox=True, transform=True, move=True, rotate=True, scale=True, polygon=True, parent=False):
+def object_mesh(obj, depsgraph=None):
     """
-    Create Bounding Box of object and/or move object to world zero
+    Get mesh of object (evaluated, with modifiers, if depsgraph is set) and
+    evaluated object owning temporary mesh (call to_mesh_clear) or None
     """
-    mesh = obj.data if transform else bpy.data.meshes.new_from_object(obj)
-    
-    transform = False if parent else transform
-    move =False if parent else move
-    rotate=False if parent else rotate
-    scale=False if parent else scale
+    if depsgraph is None:
+        return obj.data, None
+    obj_eval = obj.evaluated_get(depsgraph)
+    if isinstance(obj_eval.data, bpy.types.Mesh):
+        return obj_eval.data, None
+    # No evaluated mesh, temporary mesh is needed
+    return obj_eval.to_mesh(), obj_eval
+
+def calc_object_bb(obj, transform=True, world=False, mode='AABB', refine=True, depsgraph=None, stats=no_stats, chunk=0):
+    """
+    Get bounding box data (corners, size, origin, rotation) of object and/or move object to world zero.
+    With depsgraph box is calculated from evaluated mesh (with modifiers).
+    Empty mesh is not moved, None is returned
+    """
+    # Mesh is modified only with transform, otherwise it is only read
+    mesh = obj.data
+    with stats.stage("mesh", obj):
+        src, temp_owner = object_mesh(obj, depsgraph)
     
-    tr_matrix = Matrix.LocRotScale(obj.location, obj.rotation_euler, obj.scale) if transform else Matrix.LocRotScale(
-        vec_zero, rot_zero, vec_one)
-    mesh.transform(tr_matrix)
+    # Matrix applied to src coordinates before measuring. With transform mesh
+    # is measured under object transform and then transformed only once
+    matrix = obj.matrix_world if world else None
+    if transform:
+        matrix = Matrix.LocRotScale(obj.location, obj.rotation_euler, obj.scale)
     
+    try:
+        if len(src.vertices) == 0:
+            return None
+        with stats.stage("reduce", obj):
+            rot = Matrix.Identity(3)
+            diag = None
+            if mode == 'OBB':
+                # Refinement only needs convex hull points
+                co = get_hull(src).copy() if refine else vtx_to_array(src.vertices)
+                if matrix is not None:
+                    arr_transform(co, matrix)
+                bb_vertex, n_len, origin, rot = get_obb(co, refine)
+            else:
+                diag = world_min_max(src.vertices, matrix, chunk) if matrix is not None else get_min_max(src.vertices, chunk)
+                bb_vertex, n_len, origin = bbox_from_min_max(*diag)
+    finally:
+        if temp_owner is not None:
+            temp_owner.to_mesh_clear()
     if transform:
+        if diag is not None and depsgraph is None:
+            diag = (diag[0] - origin, diag[1] - origin)
+        else:
+            diag = None
+        with stats.stage("transform", obj):
+            mesh_transform(mesh, Matrix.Translation(-origin) @ matrix, diag)
         obj.scale = (1.0,1.0,1.0)
         obj.location = (0.0,0.0,0.0)
         obj.rotation_euler = (0.0,0.0,0.0)
-    
-    bb_vertex, n_len, origin = get_bbox(mesh.vertices)
-    mesh.transform(Matrix.Translation(-origin))
-    
-    if create_bbox:
-        if bpy.data.collections.get(obj.name) is None:
-            coll = bpy.data.collections.new(obj.name)
-            bpy.context.scene.collection.children.link(coll)
+    return bb_vertex, n_len, origin, rot
+
+def reduce_transformed(co, matrix):
+    """
+    Get min and max of (N, 3) array transformed by matrix (array is modified)
+    """
+    arr_transform(co, matrix)
+    return co.min(axis=0), co.max(axis=0)
+
+def combined_min_max(objs, depsgraph=None, threads=None, chunk=0):
+    """
+    Get 2 points defining the diagonal of the world-space bounding box around all objects.
+    Buffers are read on main thread (bpy is not thread-safe), reduced in thread pool and merged
+    """
+    mins, maxs, jobs = [], [], []
+    for obj in objs:
+        src, temp_owner = object_mesh(obj, depsgraph)
         try:
-            bpy.data.collections[obj.name].objects.link(obj)
-        except RuntimeError:
-            pass
-                        
-        bb_mesh = bpy.data.meshes.new(prefix + mesh.name)
+            if len(src.vertices) == 0:
+                continue
+            matrix = obj.matrix_world.copy()
+            if is_axis_aligned(matrix):
+                v1, v2 = corners_min_max(get_min_max(src.vertices, chunk), matrix)
+                mins.append(np.array(v1))
+                maxs.append(np.array(v2))
+                continue
+            hull = hull_cache.get(src)
+            if hull is None and 0 < chunk < len(src.vertices):
+                # Reduced on main thread to keep memory bounded
+                v1, v2 = world_min_max(src.vertices, matrix, chunk)
+                mins.append(np.array(v1))
+                maxs.append(np.array(v2))
+                continue
+            jobs.append((vtx_to_array(src.vertices) if hull is None else hull.copy(), matrix))
+        finally:
+            if temp_owner is not None:
+                temp_owner.to_mesh_clear()
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=threads or os.cpu_count()) as pool:
+            res = list(pool.map(lambda job: reduce_transformed(*job), jobs))
+    else:
+        res = [reduce_transformed(*job) for job in jobs]
+    mins.extend(r[0] for r in res)
+    maxs.extend(r[1] for r in res)
+    if len(mins) == 0:
+        return None
+    return Vector(np.min(mins, axis=0).tolist()), Vector(np.max(maxs, axis=0).tolist())
+
+def build_combined_bb(diag, name, polygon=True):
+    """
+    Create world-space Bounding Box object from diagonal points
+    """
+    bb_vertex, n_len, origin = bbox_from_min_max(*diag)
+    bb_mesh = bpy.data.meshes.new(name)
+    bbox = bpy.data.objects.new(bb_mesh.name, bb_mesh)
+    bpy.context.scene.collection.objects.link(bbox)
+    bb_vertex = [v - origin for v in bb_vertex]
+    if polygon:
+        bb_mesh.from_pydata(bb_vertex, [], bbox_faces)
+    else:
+        bb_mesh.from_pydata(bb_vertex, bbox_edges, [])
+    bbox.location = origin
+    return bbox
+
+def get_combined_bb(objs, prefix: str="BBOX", create_bbox=True, polygon=True, evaluated=False, stats=no_stats, chunk=0):
+    """
+    Get world-space bounding box data (corners, size, origin) around all objects
+    and/or create its Bounding Box object
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get() if evaluated else None
+    with stats.stage("reduce"):
+        diag = combined_min_max(objs, depsgraph, chunk=chunk)
+    if diag is None:
+        return None
+    if create_bbox:
+        with stats.stage("build"):
+            build_combined_bb(diag, prefix + "Combined", polygon)
+        with stats.stage("update"):
+            bpy.context.view_layer.update()
+    return bbox_from_min_max(*diag)
+
+def link_collections(objs, stats=no_stats):
+    """
+    Get {object name: collection} for objects. Name map of collections is built once,
+    missing collections are created and objects are linked only if not already members
+    """
+    with stats.stage("collections"):
+        colls = {coll.name: coll for coll in bpy.data.collections}
+        scene_coll = bpy.context.scene.collection
+        res = {}
+        for obj in objs:
+            coll = colls.get(obj.name)
+            if coll is None:
+                coll = bpy.data.collections.new(obj.name)
+                scene_coll.children.link(coll)
+                colls[coll.name] = coll
+            if obj.name not in coll.objects:
+                coll.objects.link(obj)
+            res[obj.name] = coll
+    return res
+
+def build_object_bb(obj, bb, prefix: str="BBOX", transform=True, move=True, rotate=True, scale=True, polygon=True, parent=False, world=False, stats=no_stats, coll=None):
+    """
+    Create Bounding Box object from calculated bounding box data.
+    coll is the object collection from link_collections
+    """
+    bb_vertex, n_len, origin, rot = bb
+    if coll is None:
+        coll = link_collections([obj], stats)[obj.name]
+    
+    with stats.stage("build", obj):
+        bb_mesh = bpy.data.meshes.new(prefix + obj.data.name)
         bbox = bpy.data.objects.new(bb_mesh.name, bb_mesh)
-        bpy.data.collections[obj.name].objects.link(bbox)
-        edges = []
-        for i in range(len(bb_vertex)-1):
-            for j in range(i+1, len(bb_vertex)):
-                if approx((bb_vertex[j]-bb_vertex[i]).length, n_len, 0.01):
-                    edges.append((i,j))
-        bb_mesh.clear_geometry()
-        bb_mesh.from_pydata(bb_vertex, edges, [])
-        if transform:
-            bb_mesh.transform(Matrix.Translation(-origin))
-            bbox.matrix_world.translation += origin
-            bbox.location -= origin
-        else:
-            bbox.location = obj.location if move else bbox.location
-            bbox.rotation_euler = obj.rotation_euler if rotate else bbox.rotation_euler
-            bbox.scale = obj.scale if scale else bbox.scale
-        if parent:
-            bbox.parent = obj
-            bbox.matrix_parent_inverse = obj.matrix_world.inverted()
+        coll.objects.link(bbox)
+        if transform or world:
+            # Box mesh in box space, box object placed at origin with box rotation
+            to_box = rot.transposed()
+            bb_vertex = [to_box @ (v - origin) for v in bb_vertex]
+    # Edges are calculated from faces
+    with stats.stage("polygons" if polygon else "edges", obj):
         if polygon:
-            mesh_buildpoly(bbox)
-    if not transform:
-        bpy.data.meshes.remove(mesh)
+            bb_mesh.from_pydata(bb_vertex, [], bbox_faces)
+        else:
+            bb_mesh.from_pydata(bb_vertex, bbox_edges, [])
+    if transform:
+        bbox.matrix_world = rot.to_4x4()
+    elif world:
+        bbox.matrix_world = Matrix.Translation(origin) @ rot.to_4x4()
+    else:
+        bbox.location = obj.location if move else bbox.location
+        bbox.rotation_euler = obj.rotation_euler if rotate else bbox.rotation_euler
+        bbox.scale = obj.scale if scale else bbox.scale
+    if parent:
+        bbox.parent = obj
+        bbox.matrix_parent_inverse = obj.matrix_world.inverted()
+    return bbox
+
+def get_objects_bb(objs, prefix: str="BBOX", create_bbox=True, transform=True, move=True, rotate=True, scale=True, polygon=True, parent=False, world=False, mode='AABB', refine=True, evaluated=False, stats=no_stats, chunk=0):
+    """
+    Create Bounding Boxes of objects and/or move objects to world zero.
+    All boxes are calculated first, then all box meshes are built, then the
+    view layer is updated once. Box data is None for empty meshes
+    """
+    transform = False if parent else transform
+    move =False if parent else move
+    rotate=False if parent else rotate
+    scale=False if parent else scale
+    world = False if transform else world
+    
+    global bbox_updating
+    depsgraph = bpy.context.evaluated_depsgraph_get() if evaluated else None
+    bboxes = [calc_object_bb(obj, transform, world, mode, refine, depsgraph, stats, chunk) for obj in objs]
+    if create_bbox:
+        # Empty meshes are skipped
+        built = [(obj, bb) for obj, bb in zip(objs, bboxes) if bb is not None]
+        colls = link_collections([obj for obj, bb in built], stats)
+        for obj, bb in built:
+            build_object_bb(obj, bb, prefix, transform, move, rotate, scale, polygon, parent, world, stats, colls[obj.name])
+    # Caches of transformed meshes are already updated
+    bbox_updating = True
+    try:
+        with stats.stage("update"):
+            bpy.context.view_layer.update()
+    finally:
+        bbox_updating = False
+    return bboxes
+
+def get_object_bb(obj, prefix: str="BBOX", create_bbox=True, transform=True, move=True, rotate=True, scale=True, polygon=True, parent=False, world=False, mode='AABB', refine=True, evaluated=False, stats=no_stats, chunk=0):
+    """
+    Create Bounding Box of object and/or move object to world zero
+    """
+    return get_objects_bb([obj], prefix, create_bbox, transform, move, rotate, scale, polygon, parent, world, mode, refine, evaluated, stats, chunk)[0]
     
 
 # For testing
@@ -152,7 +805,233 @@ def get_object_bb(obj, prefix: str="BBOX", create_bbox=True, transform=True, mov
 
 
 
+# Printability check: bounding box sizes of parts against printer build volumes.
+# Build volumes are in millimeters (X, Y, Z)
+print_volumes = OrderedDict((
+    ("Prusa MK4", (250.0, 210.0, 220.0)),
+    ("Prusa MINI", (180.0, 180.0, 180.0)),
+    ("Creality Ender-3", (220.0, 220.0, 250.0)),
+    ("Bambu Lab X1", (256.0, 256.0, 256.0)),
+    ("Formlabs Form 3", (145.0, 145.0, 185.0)),
+))
+
+# Axis permutations of the 6 axis-aligned orientations, first is part as modeled
+print_orients = np.array(((0, 1, 2), (1, 0, 2), (0, 2, 1), (2, 0, 1), (1, 2, 0), (2, 1, 0)))
+
+def fit_volumes(sizes, volumes):
+    """
+    Check (N, 3) part sizes against (P, 3) build volumes in all orientations at once.
+    Get (N, P) array: index of first fitting orientation or -1
+    """
+    sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 3)
+    volumes = np.asarray(volumes, dtype=np.float64).reshape(-1, 3)
+    # (N, 1, 6, 3) <= (1, P, 1, 3) -> (N, P, 6)
+    fits = np.all(sizes[:, None, print_orients] <= volumes[:, None, :], axis=-1)
+    return np.where(fits.any(axis=-1), fits.argmax(axis=-1), -1)
+
+def part_sizes(objs, mode='AABB', refine=True, depsgraph=None, stats=no_stats, chunk=0):
+    """
+    Get (N, 3) sizes of objects (NaN for empty meshes): mesh-space AABB
+    scaled by object scale or world-space OBB
+    """
+    sizes = np.full((len(objs), 3), np.nan)
+    for i, obj in enumerate(objs):
+        src, temp_owner = object_mesh(obj, depsgraph)
+        try:
+            if len(src.vertices) == 0:
+                continue
+            with stats.stage("reduce", obj):
+                if mode == 'OBB':
+                    co = get_hull(src).copy() if refine else vtx_to_array(src.vertices)
+                    arr_transform(co, obj.matrix_world)
+                    size = get_obb(co, refine)[1]
+                else:
+                    v1, v2 = get_min_max(src.vertices, chunk)
+                    size = np.array(v2 - v1) * np.abs(np.array(obj.matrix_world.to_scale()))
+        finally:
+            if temp_owner is not None:
+                temp_owner.to_mesh_clear()
+        sizes[i] = size
+    return sizes
+
+def check_printable(objs, volumes, unit_mm=1000.0, mode='AABB', refine=True, evaluated=False, stats=no_stats, chunk=0):
+    """
+    Get part sizes in millimeters and fitting orientations (see fit_volumes)
+    of objects in build volumes {name: (x, y, z)}
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get() if evaluated else None
+    sizes = part_sizes(objs, mode, refine, depsgraph, stats, chunk) * unit_mm
+    with stats.stage("fit"):
+        fits = fit_volumes(sizes, list(volumes.values()))
+    return sizes, fits
+
+def print_report_lines(objs, sizes, fits, names):
+    """
+    Get report lines: part size and fit (upright, rotated or no) per build volume
+    """
+    lines = ["%-32s %28s  %s" % ("part", "size, mm", "  ".join(names))]
+    for obj, size, fit in zip(objs, sizes, fits):
+        if np.isnan(size[0]):
+            lines.append("%-32s %28s" % (obj.name, "empty"))
+            continue
+        lines.append("%-32s %8.1f x %7.1f x %7.1f  %s" % (obj.name, *size, "  ".join(
+            ("%%-%is" % len(name)) % ("no" if f < 0 else "upright" if f == 0 else "rotated")
+            for name, f in zip(names, fit))))
+    return lines
+
+
+
+# Live overlay: bounding boxes of selected objects are drawn in viewport without datablocks.
+# Extents are recalculated only for objects with updated geometry
+live_handle = None
+live_shader = None
+live_batch = None
+live_extents = {} # {object pointer: diagonal points in mesh space or None}
+live_dirty = set()
+live_color = (1.0, 0.6, 0.0, 1.0)
+live_key = "bbox_live_handle" # Key of draw handler in bpy.app.driver_namespace
+
+def live_get_shader():
+    """
+    Get builtin uniform color shader (created once)
+    """
+    global live_shader
+    if live_shader is None:
+        try:
+            live_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        except ValueError:
+            # Blender < 4.0
+            live_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    return live_shader
+
+def edit_min_max(obj, depsgraph):
+    """
+    Get diagonal of the bounding box of object in edit mode or None. Read from bound box
+    of evaluated object (synced with edit mesh, modifiers shown in edit mode are included)
+    """
+    if len(bmesh.from_edit_mesh(obj.data).verts) == 0:
+        return None
+    return arr_min_max(np.array(obj.evaluated_get(depsgraph).bound_box, dtype=np.float32))
+
+def live_build_batch(context):
+    """
+    Build batch of lines of bounding boxes of selected mesh objects
+    """
+    depsgraph = context.evaluated_depsgraph_get() if context.scene.bbox_props.bbox_evaluated else None
+    corners, matrices, extents = [], [], {}
+    for obj in context.selected_objects:
+        if not isinstance(obj.data, bpy.types.Mesh):
+            continue
+        key = obj.as_pointer()
+        if key in live_extents and key not in live_dirty:
+            diag = live_extents[key]
+        elif depsgraph is None and obj.data.is_editmode:
+            # obj.data is not synced with edit mesh
+            diag = edit_min_max(obj, context.evaluated_depsgraph_get())
+            live_dirty.discard(key)
+        else:
+            src, temp_owner = object_mesh(obj, depsgraph)
+            try:
+                diag = get_min_max(src.vertices, context.scene.bbox_props.bbox_chunk) if len(src.vertices) > 0 else None
+            finally:
+                if temp_owner is not None:
+                    temp_owner.to_mesh_clear()
+            live_dirty.discard(key)
+        extents[key] = diag
+        if diag is not None:
+            corners.append([v[:] for v in v_shuffles(diag)])
+            matrices.append(obj.matrix_world)
+    # Keep extents of selected objects only
+    live_extents.clear()
+    live_extents.update(extents)
+    if len(corners) == 0:
+        return None
+    corners = np.array(corners, dtype=np.float32)
+    matrices = np.array(matrices, dtype=np.float32)
+    corners = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    coords = corners[:, np.array(bbox_edges).ravel()].reshape(-1, 3)
+    return batch_for_shader(live_get_shader(), 'LINES', {"pos": coords})
+
+def live_draw():
+    """
+    Draw handler of live overlay, batch is rebuilt only after updates
+    """
+    global live_batch
+    context = bpy.context
+    if not context.scene.bbox_props.bbox_live:
+        return
+    if live_batch is None:
+        live_batch = live_build_batch(context)
+        if live_batch is None:
+            return
+    shader = live_get_shader()
+    gpu.state.line_width_set(2.0)
+    shader.uniform_float("color", live_color)
+    live_batch.draw(shader)
+    gpu.state.line_width_set(1.0)
+
+@persistent
+def live_frame_change(*args):
+    """
+    Animated objects are moved without depsgraph update handler
+    """
+    global live_batch
+    live_batch = None
+
+def live_enable(enable):
+    """
+    Add or remove draw handler of live overlay
+    """
+    global live_handle, live_batch
+    if enable and live_handle is None:
+        live_handle = bpy.types.SpaceView3D.draw_handler_add(live_draw, (), 'WINDOW', 'POST_VIEW')
+        # Stored outside of module to be removed after re-running script
+        bpy.app.driver_namespace[live_key] = live_handle
+        bpy.app.handlers.frame_change_post.append(live_frame_change)
+    elif not enable and live_handle is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(live_handle, 'WINDOW')
+        live_handle = None
+        bpy.app.driver_namespace.pop(live_key, None)
+        remove_handlers(bpy.app.handlers.frame_change_post, live_frame_change)
+        live_extents.clear()
+        live_dirty.clear()
+    live_batch = None
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def remove_handlers(handlers, func):
+    """
+    Remove handlers with name of func, also left by previous runs of script
+    """
+    for handler in [h for h in handlers if getattr(h, "__name__", None) == func.__name__]:
+        handlers.remove(handler)
+
+def remove_stale_handlers():
+    """
+    Remove handlers and draw handler of previous runs of script
+    """
+    remove_handlers(bpy.app.handlers.depsgraph_update_post, bbox_depsgraph_update)
+    remove_handlers(bpy.app.handlers.load_post, bbox_load_post)
+    remove_handlers(bpy.app.handlers.frame_change_post, live_frame_change)
+    handle = bpy.app.driver_namespace.pop(live_key, None)
+    if handle is not None and handle is not live_handle:
+        try:
+            bpy.types.SpaceView3D.draw_handler_remove(handle, 'WINDOW')
+        except ValueError:
+            pass
+
+def live_update(self, context):
+    live_enable(self.bbox_live)
+
 class BBoxPropertyGroup(bpy.types.PropertyGroup):
+    bbox_live : bpy.props.BoolProperty(
+        name="Live BBoxes",
+        default=False,
+        description="Draw bounding boxes of selected objects in viewport without creating objects",
+        update=live_update
+        )
     bbox_createbbox : bpy.props.BoolProperty(
         name="Create BBox",
         default=True
@@ -162,10 +1041,33 @@ class BBoxPropertyGroup(bpy.types.PropertyGroup):
         default="BBOX.",
         description="BBox name prefix"
         )
+    bbox_mode : bpy.props.EnumProperty(
+        name="BBox type",
+        items=(
+            ('AABB', "AABB", "Axis-aligned bounding box"),
+            ('OBB', "OBB", "Oriented bounding box (PCA)"),
+        ),
+        default='AABB'
+        )
+    bbox_obbrefine : bpy.props.BoolProperty(
+        name="Refine OBB",
+        default=True,
+        description="Refine PCA axes by rotating calipers on convex hull"
+        )
     bbox_transform : bpy.props.BoolProperty(
         name="Transform to Zero",
         default=True
         )
+    bbox_world : bpy.props.BoolProperty(
+        name="World AABB",
+        default=False,
+        description="Axis-aligned box in world space (without Transform to Zero)"
+        )
+    bbox_combined : bpy.props.BoolProperty(
+        name="Combined",
+        default=False,
+        description="One world-space AABB around all objects"
+        )
     bbox_move : bpy.props.BoolProperty(
         name="Move",
         default=True
@@ -178,6 +1080,17 @@ class BBoxPropertyGroup(bpy.types.PropertyGroup):
         name="Scale",
         default=True
         )
+    bbox_evaluated : bpy.props.BoolProperty(
+        name="Use modifiers",
+        default=False,
+        description="Calculate bbox from evaluated mesh (with modifiers) without applying them"
+        )
+    bbox_chunk : bpy.props.IntProperty(
+        name="Chunk size",
+        default=0,
+        min=0,
+        description="Read vertex positions in windows of this many vertices to bound memory (0 - whole mesh at once)"
+        )
     bbox_polygon : bpy.props.BoolProperty(
         name="Polygon",
         default=True
@@ -207,8 +1120,66 @@ class BBoxPropertyGroup(bpy.types.PropertyGroup):
         name="Parent BBox to object",
         default=False
         )
+    bbox_printvolume : bpy.props.FloatVectorProperty(
+        name="Custom build volume",
+        size=3,
+        default=(0.0, 0.0, 0.0),
+        min=0.0,
+        description="Custom printer build volume in millimeters (ignored if zero)"
+        )
+    bbox_printreport : bpy.props.StringProperty(
+        name="Print report",
+        default="BBOX_print_report",
+        description="Text datablock for printability report"
+        )
+    bbox_timing : bpy.props.BoolProperty(
+        name="Timing",
+        default=False,
+        description="Report per-stage timings (see system console for slowest objects)"
+        )
+    bbox_timing_json : bpy.props.StringProperty(
+        name="Timing JSON",
+        default="",
+        subtype='FILE_PATH',
+        description="Dump timings to JSON file (optional)"
+        )
 
 
+@functools.lru_cache(maxsize=16)
+def bbox_name_regex(subname):
+    """
+    Get compiled regex '.*subname.*' of bounding box names
+    """
+    return re.compile(".*" + subname + ".*")
+
+def get_candidates(context, bbox_props):
+    """
+    Get objects for bounding boxes. Filtering starts from selected or visible objects
+    of view layer, so it does not depend on count of all objects in file
+    """
+    if not bbox_props.bbox_selectall:
+        objs = context.selected_objects
+    elif bbox_props.bbox_visible:
+        objs = context.visible_objects
+    else:
+        objs = context.view_layer.objects
+    bbox_name = bbox_name_regex(bbox_props.bbox_ignorename) if bbox_props.bbox_ignorebbox else None
+    res = []
+    for obj in objs:
+        if not isinstance(obj.data, bpy.types.Mesh):
+            continue
+        # Skip invisible object
+        elif bbox_props.bbox_visible and not obj.visible_get():
+            continue
+        # Skip non-rendable objects
+        elif bbox_props.bbox_render and obj.hide_render:
+            continue
+        # Skip bounding boxes
+        elif bbox_name is not None and bbox_name.match(obj.name) is not None:
+            continue
+        res.append(obj)
+    return res
+
 class BBoxButton(bpy.types.Operator):
     bl_label = "Evaluate"
     bl_idname = "bbox.button1"
@@ -223,31 +1194,64 @@ class BBoxButton(bpy.types.Operator):
             return {'FINISHED'}
         scene = bpy.context.scene
         bbox_props = scene.bbox_props
-        bbox_name = re.compile(".*" + bbox_props.bbox_ignorename + ".*")
-        names = []
-        for obj in bpy.data.objects:
-            if not isinstance(obj.data, bpy.types.Mesh):
-                continue
-            # Skip unselected objects
-            elif not obj.select_get() and not bbox_props.bbox_selectall:
-                continue
-            # Skip invisible object
-            elif not obj.visible_get() and bbox_props.bbox_visible:
-                continue
-            # Skip non-rendable objects
-            elif obj.hide_render and bbox_props.bbox_render:
-                continue
-            # Skip bounding boxes
-            elif bbox_props.bbox_ignorebbox and bbox_name.match(obj.name) is not None:
-                continue
-            get_object_bb(obj, bbox_props.bbox_createname, bbox_props.bbox_createbbox,
+        stats = BBoxStats() if bbox_props.bbox_timing else no_stats
+        with stats.stage("filter"):
+            objs = get_candidates(context, bbox_props)
+        if bbox_props.bbox_combined:
+            get_combined_bb(objs, bbox_props.bbox_createname, bbox_props.bbox_createbbox,
+                bbox_props.bbox_polygon, bbox_props.bbox_evaluated, stats, bbox_props.bbox_chunk)
+        else:
+            get_objects_bb(objs, bbox_props.bbox_createname, bbox_props.bbox_createbbox,
                 bbox_props.bbox_transform,
                 bbox_props.bbox_move, bbox_props.bbox_rotate, bbox_props.bbox_scale,
-                bbox_props.bbox_polygon, bbox_props.bbox_parent)
-            names.append(obj.name)
+                bbox_props.bbox_polygon, bbox_props.bbox_parent, bbox_props.bbox_world,
+                bbox_props.bbox_mode, bbox_props.bbox_obbrefine, bbox_props.bbox_evaluated, stats,
+                bbox_props.bbox_chunk)
+        names = [obj.name for obj in objs]
         if len(names) == 0:
             names.append("NOTHING!!!")
         self.report({'INFO'}, "[BBOX] Evaluated for: %s" % ", ".join(names))
+        if stats.enabled:
+            print("\n".join(stats.report_lines()))
+            self.report({'INFO'}, "[BBOX] Timing: %s" % stats.summary())
+            if bbox_props.bbox_timing_json:
+                stats.dump(bpy.path.abspath(bbox_props.bbox_timing_json))
+        return {'FINISHED'}
+
+
+class BBoxPrintCheck(bpy.types.Operator):
+    """Check bounding boxes of objects against printer build volumes"""
+    bl_label = "Check Printability"
+    bl_idname = "bbox.printcheck"
+    
+    def execute(self, context):
+        scene = bpy.context.scene
+        bbox_props = scene.bbox_props
+        stats = BBoxStats() if bbox_props.bbox_timing else no_stats
+        with stats.stage("filter"):
+            objs = get_candidates(context, bbox_props)
+        if len(objs) == 0:
+            self.report({'INFO'}, "[BBOX] Nothing to check")
+            return {'FINISHED'}
+        volumes = OrderedDict(print_volumes)
+        if min(bbox_props.bbox_printvolume) > 0.0:
+            volumes["Custom"] = tuple(bbox_props.bbox_printvolume)
+        unit_mm = scene.unit_settings.scale_length * 1000.0
+        sizes, fits = check_printable(objs, volumes, unit_mm, bbox_props.bbox_mode,
+            bbox_props.bbox_obbrefine, bbox_props.bbox_evaluated, stats, bbox_props.bbox_chunk)
+        names = list(volumes.keys())
+        lines = print_report_lines(objs, sizes, fits, names)
+        text = bpy.data.texts.get(bbox_props.bbox_printreport)
+        if text is None:
+            text = bpy.data.texts.new(bbox_props.bbox_printreport)
+        text.from_string("\n".join(lines) + "\n")
+        print("\n".join(lines))
+        counts = (fits >= 0).sum(axis=0)
+        self.report({'INFO'}, "[BBOX] Printable of %i: %s (see text '%s')" % (len(objs),
+            ", ".join("%s %i" % e for e in zip(names, counts)), text.name))
+        if stats.enabled:
+            print("\n".join(stats.report_lines()))
+            self.report({'INFO'}, "[BBOX] Timing: %s" % stats.summary())
         return {'FINISHED'}
 
 
@@ -265,20 +1269,33 @@ class BBoxPanel(bpy.types.Panel):
         
         # Create bbox
         layout.operator(BBoxButton.bl_idname) # Button
+        layout.prop(bbox_props, "bbox_live")
         box = layout.box()
         box.prop(bbox_props, "bbox_createbbox", text="Create BBox | BBox name prefix")
         row = box.row()
         row.active = bbox_props.bbox_createbbox
         row.prop(bbox_props, "bbox_createname", text="")
+        box.prop(bbox_props, "bbox_combined")
+        row = box.row()
+        row.enabled = not bbox_props.bbox_combined
+        row.prop(bbox_props, "bbox_mode", expand=True)
+        column = row.column()
+        column.enabled = bbox_props.bbox_mode == 'OBB'
+        column.prop(bbox_props, "bbox_obbrefine")
         
         # Transform
         row = layout.row()
         column = row.column()
         column.prop(bbox_props, "bbox_transform")
         column.prop(bbox_props, "bbox_polygon")
+        column.prop(bbox_props, "bbox_evaluated")
+        column.prop(bbox_props, "bbox_chunk")
         column.prop(bbox_props, "bbox_selectall")
         column = row.column()
-        column.enabled = not bbox_props.bbox_transform
+        column.enabled = not bbox_props.bbox_transform and not bbox_props.bbox_combined
+        column.prop(bbox_props, "bbox_world")
+        column = column.column()
+        column.enabled = not bbox_props.bbox_world
         column.prop(bbox_props, "bbox_move")
         column.prop(bbox_props, "bbox_rotate")
         column.prop(bbox_props, "bbox_scale")
@@ -297,11 +1314,33 @@ class BBoxPanel(bpy.types.Panel):
         column.label(text="As regex '.*%subname%.*'")
         column.prop(bbox_props, "bbox_ignorename", text="")
         
+        # Printability
+        box = layout.box()
+        box.operator(BBoxPrintCheck.bl_idname)
+        box.prop(bbox_props, "bbox_printvolume")
+        box.prop(bbox_props, "bbox_printreport", text="Report")
+        
+        # Timing
+        row = layout.row()
+        row.prop(bbox_props, "bbox_timing")
+        column = row.column()
+        column.enabled = bbox_props.bbox_timing
+        column.prop(bbox_props, "bbox_timing_json", text="")
+        
 def register():
     bpy.utils.register_class(BBoxPropertyGroup)
     bpy.utils.register_class(BBoxButton)
+    bpy.utils.register_class(BBoxPrintCheck)
     #bpy.utils.register_class(BBoxPanel)
     bpy.types.Scene.bbox_props = bpy.props.PointerProperty(type=BBoxPropertyGroup)
+    remove_stale_handlers()
+    bpy.app.handlers.depsgraph_update_post.append(bbox_depsgraph_update)
+    bpy.app.handlers.load_post.append(bbox_load_post)
+    try:
+        live_enable(any(scene.bbox_props.bbox_live for scene in bpy.data.scenes))
+    except AttributeError:
+        # Restricted context on add-on loading, load_post enables overlay
+        pass
     # https://blender.stackexchange.com/questions/41933/bl-context-multiple-areas
     contexts = ["object", "scene"]
     for c in contexts:
@@ -315,6 +1354,7 @@ def register():
 def unregister():
     bpy.utils.unregister_class(BBoxPropertyGroup)
     bpy.utils.unregister_class(BBoxButton)
+    bpy.utils.unregister_class(BBoxPrintCheck)
     #bpy.utils.unregister_class(BBoxPanel)
     contexts = ["object", "scene"]
     for c in contexts:
@@ -323,10 +1363,297 @@ def unregister():
                    }
         MyPanel = type("BBoxPanel_%s" % c, (BBoxPanel,), propdic)
         bpy.utils.unregister_class(MyPanel)
+    live_enable(False)
     del bpy.types.Scene.bbox_props
+    remove_stale_handlers()
+
+
+# Streaming readers of exported mesh files. Every reader yields (N, 3) arrays
+# of at most chunk vertices, so memory does not depend on file size
+
+def iter_text_chunks(lines, chunk):
+    """
+    Convert lines with "x y z" to (N, 3) arrays
+    """
+    buf = []
+    for line in lines:
+        buf.append(line)
+        if len(buf) >= chunk:
+            yield np.array([l.split()[:3] for l in buf], dtype=np.float64)
+            buf = []
+    if buf:
+        yield np.array([l.split()[:3] for l in buf], dtype=np.float64)
+
+def iter_obj_chunks(path, chunk=1 << 20):
+    """
+    Read vertex positions ("v x y z" lines) from Wavefront OBJ file
+    """
+    with open(path, "r", errors="replace") as f:
+        # Keyword is separated by any whitespace ("v\t1 2 3")
+        words = (line.split(None, 1) for line in f)
+        yield from iter_text_chunks((w[1] for w in words if len(w) == 2 and w[0] == "v"), chunk)
+
+def iter_stl_chunks(path, chunk=1 << 20):
+    """
+    Read triangle corners from binary (memory-mapped) or ASCII STL file
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(84)
+        count = int.from_bytes(head[80:84], "little") if len(head) == 84 else -1
+        if size != 84 + 50 * count:
+            if not head.lstrip().startswith(b"solid"):
+                raise ValueError("Invalid STL file: %s" % path)
+            f.seek(0)
+            lines = (line.split(None, 1)[1].decode() for line in f if line.lstrip().startswith(b"vertex"))
+            yield from iter_text_chunks(lines, chunk)
+            return
+        if count == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tris = np.frombuffer(mm, dtype=stl_dtype, count=count, offset=84)
+            step = max(1, chunk // 3)
+            for i in range(0, count, step):
+                yield tris["v"][i:i+step].reshape(-1, 3)
+            del tris
+
+stl_dtype = np.dtype([("n", "<f4", (3,)), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+
+ply_types = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+def iter_ply_chunks(path, chunk=1 << 20):
+    """
+    Read vertex positions from binary (memory-mapped) or ASCII PLY file
+    """
+    with open(path, "rb") as f:
+        if f.readline().strip() != b"ply":
+            raise ValueError("Invalid PLY file: %s" % path)
+        fmt, count, props, element = None, 0, [], None
+        for line in f:
+            words = line.decode("ascii", "replace").split()
+            if len(words) == 0 or words[0] in ("comment", "obj_info"):
+                continue
+            if words[0] == "end_header":
+                break
+            if words[0] == "format":
+                fmt = words[1]
+            elif words[0] == "element":
+                element = words[1]
+                if element == "vertex":
+                    count = int(words[2])
+                elif count == 0:
+                    # Vertices must be first element for streaming
+                    raise ValueError("PLY vertex element is not first: %s" % path)
+            elif words[0] == "property" and element == "vertex":
+                if words[1] == "list":
+                    raise ValueError("PLY list property of vertex is not supported: %s" % path)
+                props.append((words[2], ply_types[words[1]]))
+        offset = f.tell()
+        names = [name for name, _ in props]
+        if count == 0:
+            return
+        if fmt == "ascii":
+            ids = [names.index(axis) for axis in "xyz"]
+            lines = (" ".join(line.split()[i] for i in ids)
+                for line, _ in zip((l.decode() for l in f), range(count)))
+            yield from iter_text_chunks(lines, chunk)
+            return
+        order = "<" if fmt == "binary_little_endian" else ">"
+        dtype = np.dtype([(name, order + t) for name, t in props])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            verts = np.frombuffer(mm, dtype=dtype, count=count, offset=offset)
+            for i in range(0, count, chunk):
+                part = verts[i:i+chunk]
+                yield np.stack((part["x"], part["y"], part["z"]), axis=1)
+            del verts, part
+
+# Readers by file extension and axis conversion of Blender importers (default settings)
+mesh_readers = {
+    ".obj": (iter_obj_chunks, Matrix(((1, 0, 0), (0, 0, -1), (0, 1, 0)))), # Y up -> Z up
+    ".ply": (iter_ply_chunks, None),
+    ".stl": (iter_stl_chunks, None),
+}
+
+def get_file_bbox(path, chunk=1 << 20):
+    """
+    Get bounding box data (corners, size, origin) of exported mesh file without loading it to Blender
+    """
+    reader, matrix = mesh_readers[os.path.splitext(path)[1].lower()]
+    diag = chunks_min_max(reader(path, chunk))
+    if matrix is not None:
+        diag = corners_min_max(diag, matrix)
+    return bbox_from_min_max(*diag)
+
+
+# Headless batch processing of .blend files:
+# blender --background --factory-startup --python bbox.py -- [options] files...
+# Every .blend file is processed by its own Blender worker process,
+# exported meshes (.obj, .ply, .stl) are streamed without loading to Blender
+cli_marker = "BBOX_RESULT "
+
+def cli_parser():
+    parser = argparse.ArgumentParser(
+        prog="blender --background --factory-startup --python bbox.py --",
+        description="Create Bounding Boxes and/or transform objects to zero in many .blend files")
+    parser.add_argument("files", nargs="+", help=".blend files, exported meshes (.obj, .ply, .stl) or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of Blender worker processes")
+    parser.add_argument("-r", "--report", default="", help="Report file (.json or .csv), printed to console if not set")
+    parser.add_argument("--save", action="store_true", help="Save processed files in place")
+    parser.add_argument("--no-bbox", action="store_true", help="Don't create BBox objects")
+    parser.add_argument("--no-transform", action="store_true", help="Don't transform objects to zero")
+    parser.add_argument("--prefix", default="BBOX.", help="BBox name prefix")
+    parser.add_argument("--ignore", default="BBOX", help="Skip objects with names matching regex '.*IGNORE.*'")
+    parser.add_argument("--mode", choices=("AABB", "OBB"), default="AABB", help="BBox type")
+    parser.add_argument("--evaluated", action="store_true", help="Use modifiers")
+    parser.add_argument("--vertex-chunk", type=int, default=0,
+        help="Read vertex positions of .blend meshes in windows of this many vertices (0 - whole mesh)")
+    parser.add_argument("--timeout", type=float, default=None, help="Timeout per file in seconds")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+def cli_worker_argv(args):
+    """
+    Get worker options from parsed arguments
+    """
+    argv = ["--worker", "--prefix", args.prefix, "--ignore", args.ignore, "--mode", args.mode,
+        "--vertex-chunk", str(args.vertex_chunk)]
+    for flag in ("save", "no_bbox", "no_transform", "evaluated"):
+        if getattr(args, flag):
+            argv.append("--" + flag.replace("_", "-"))
+    return argv
+
+def cli_worker(args):
+    """
+    Process .blend file opened in this Blender and print result for cli_main
+    """
+    res = {"file": bpy.data.filepath, "objects": []}
+    try:
+        bbox_name = bbox_name_regex(args.ignore) if args.ignore else None
+        objs = [obj for obj in bpy.context.scene.objects
+            if isinstance(obj.data, bpy.types.Mesh) and (bbox_name is None or bbox_name.match(obj.name) is None)]
+        bboxes = get_objects_bb(objs, args.prefix, not args.no_bbox, not args.no_transform,
+            mode=args.mode, evaluated=args.evaluated, chunk=args.vertex_chunk)
+        for obj, bb in zip(objs, bboxes):
+            if bb is None:
+                continue
+            bb_vertex, size, origin, rot = bb
+            res["objects"].append({
+                "name": obj.name,
+                "size": list(size),
+                "origin": list(origin),
+                "rotation": [list(row) for row in rot],
+            })
+        if args.save:
+            bpy.ops.wm.save_mainfile()
+    except Exception as e:
+        res["error"] = repr(e)
+    print(cli_marker + json.dumps(res))
+
+def cli_run_file(path, worker_argv, timeout=None):
+    """
+    Process .blend file in new Blender process and get its result
+    """
+    cmd = [bpy.app.binary_path, "--background", "--factory-startup", path,
+        "--python", os.path.abspath(__file__), "--", *worker_argv, path]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"file": path, "objects": [], "error": "Timeout"}
+    for line in proc.stdout.splitlines():
+        if line.startswith(cli_marker):
+            return json.loads(line[len(cli_marker):])
+    return {"file": path, "objects": [],
+        "error": "Worker failed (%i): %s" % (proc.returncode, proc.stderr.strip()[-500:])}
+
+def cli_read_file(path):
+    """
+    Get result for exported mesh file without Blender worker
+    """
+    try:
+        bb_vertex, size, origin = get_file_bbox(path)
+    except Exception as e:
+        return {"file": path, "objects": [], "error": repr(e)}
+    return {"file": path, "objects": [{
+        "name": os.path.basename(path),
+        "size": list(size),
+        "origin": list(origin),
+        "rotation": [list(row) for row in Matrix.Identity(3)],
+    }]}
+
+def cli_process(path, worker_argv, timeout=None):
+    """
+    Get result for .blend or exported mesh file
+    """
+    if os.path.splitext(path)[1].lower() in mesh_readers:
+        return cli_read_file(path)
+    return cli_run_file(path, worker_argv, timeout)
+
+def cli_expand(patterns):
+    """
+    Get sorted list of files from paths and glob patterns and list of patterns without files
+    """
+    files = set()
+    missing = []
+    for pattern in patterns:
+        found = glob.glob(pattern, recursive=True)
+        found = found if found else [pattern] if os.path.isfile(pattern) else []
+        if len(found) == 0:
+            missing.append(pattern)
+        files.update(found)
+    return sorted(os.path.abspath(f) for f in files), missing
+
+def cli_report(results, path):
+    """
+    Write results as JSON or CSV (by extension)
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("file", "object", "size_x", "size_y", "size_z",
+                "origin_x", "origin_y", "origin_z", "error"))
+            for res in results:
+                if len(res["objects"]) == 0:
+                    writer.writerow((res["file"], "", "", "", "", "", "", "", res.get("error", "")))
+                for obj in res["objects"]:
+                    writer.writerow((res["file"], obj["name"], *obj["size"], *obj["origin"], res.get("error", "")))
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+def cli_main(argv):
+    """
+    Run command line interface. Return exit code
+    """
+    args = cli_parser().parse_args(argv)
+    if args.worker:
+        cli_worker(args)
+        return 0
+    files, missing = cli_expand(args.files)
+    worker_argv = cli_worker_argv(args)
+    # Threads mostly wait for worker processes
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda path: cli_process(path, worker_argv, args.timeout), files))
+    # Mistyped paths are reported as failures
+    for pattern in missing:
+        print("[BBOX] No files match: %s" % pattern)
+        results.append({"file": pattern, "objects": [], "error": "No files match"})
+    if args.report:
+        cli_report(results, args.report)
+    else:
+        print(json.dumps(results, indent=2))
+    errors = [res for res in results if "error" in res]
+    print("[BBOX] Processed %i file(s), failed: %i" % (len(results), len(errors)))
+    return 1 if len(errors) > 0 else 0
 
 
 if __name__ == "__main__":
+    if bpy.app.background and "--" in sys.argv:
+        sys.exit(cli_main(sys.argv[sys.argv.index("--") + 1:]))
     register()
         
         
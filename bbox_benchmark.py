@@ -0,0 +1,201 @@
+# Benchmark and regression check for bbox.py on synthetic meshes
+# blender --background --factory-startup --python bbox_benchmark.py -- [options]
+
+import bpy
+import argparse, json, os, sys, time, tracemalloc
+import numpy as np
+from mathutils import Matrix
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bbox
+
+default_baseline = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bbox_benchmark.json")
+
+def make_mesh(name, n, seed=0):
+    """
+    Create mesh with n random vertices (no edges/faces) without Python loops
+    """
+    rng = np.random.default_rng(seed)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(n)
+    mesh.vertices.foreach_set("co", (rng.random(n * 3, dtype=np.float32) - 0.5) * 10.0)
+    mesh.update()
+    return mesh
+
+def make_object(name, n, seed=0):
+    """
+    Create object with random mesh, linked to scene and selected
+    """
+    obj = bpy.data.objects.new(name, make_mesh(name, n, seed))
+    bpy.context.scene.collection.objects.link(obj)
+    obj.location = (seed % 10, seed // 10 % 10, 0.0)
+    obj.rotation_euler = (0.1, 0.2, 0.3)
+    obj.select_set(True)
+    return obj
+
+def clear_scene():
+    """
+    Remove all objects, meshes and collections
+    """
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for coll in list(bpy.data.collections):
+        bpy.data.collections.remove(coll)
+    bbox.bbox_cache.clear()
+    bbox.hull_cache.clear()
+
+def current_rss():
+    """
+    Get current resident set size (bytes) of process, 0 if unknown
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def measure(func, repeat=3, setup=None):
+    """
+    Get best time (seconds), peak traced memory (bytes) and RSS growth (bytes) of func.
+    tracemalloc sees only Python allocations, RSS growth also includes Blender ones
+    """
+    best, peak, rss = float("inf"), 0, 0
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        rss_start = current_rss()
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(arg) if setup is not None else func()
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        rss = max(rss, current_rss() - rss_start)
+    return best, peak, rss
+
+def bench_mesh(n, repeat):
+    """
+    Time stages of single mesh with n vertices
+    """
+    res = {}
+    obj = make_object("BENCH", n)
+    mesh = obj.data
+    co = bbox.vtx_to_array(mesh.vertices)
+    bb = bbox.calc_object_bb(obj, transform=False)
+    res["extract"] = measure(lambda: bbox.vtx_to_array(mesh.vertices), repeat)
+    res["reduce"] = measure(lambda: bbox.arr_min_max(co), repeat)
+    res["chunked_reduce"] = measure(lambda: bbox.chunks_min_max(co[i:i+65536] for i in range(0, n, 65536)), repeat)
+    res["chunked_extract"] = measure(lambda _: bbox.get_min_max(mesh.vertices, 65536), repeat,
+        setup=bbox.bbox_cache.clear)
+    if n <= 1000000:
+        # Previous per-Vector path, too slow for bigger meshes
+        res["reduce_vectors"] = measure(lambda: bbox.v_min_max([v.co for v in mesh.vertices]), 1)
+    res["world_reduce"] = measure(lambda _: bbox.world_min_max(mesh.vertices, obj.matrix_world), repeat,
+        setup=bbox.hull_cache.clear)
+    res["obb"] = measure(lambda: bbox.get_obb(co, refine=False), repeat)
+    res["build"] = measure(lambda: bbox.build_object_bb(obj, bb, polygon=False, transform=False), repeat)
+    res["polygon"] = measure(lambda: bbox.build_object_bb(obj, bb, polygon=True, transform=False), repeat)
+    res["transform"] = measure(lambda: bbox.mesh_transform(mesh, Matrix.Translation((0.001, 0.0, 0.0))), repeat)
+    clear_scene()
+    return res
+
+def bench_objects(count, n, repeat):
+    """
+    Time BBoxButton.execute for count objects with n vertices
+    """
+    def setup():
+        clear_scene()
+        for i in range(count):
+            make_object("BENCH.%i" % i, n, i)
+    props = bpy.context.scene.bbox_props
+    props.bbox_selectall = True
+    props.bbox_visible = False
+    res = {
+        "execute": measure(lambda _: bpy.ops.bbox.button1(), repeat, setup=setup),
+        "combined": measure(lambda _: bbox.get_combined_bb(list(bpy.data.objects)), repeat, setup=setup),
+    }
+    clear_scene()
+    return res
+
+# Stages allocating mostly in Blender (not seen by tracemalloc), checked by RSS growth
+blender_stages = ("build", "polygon", "transform", "execute", "combined")
+
+def compare(results, baseline, threshold, min_time, min_mem):
+    """
+    Get list of regressions: stages slower or using more memory than baseline * threshold
+    """
+    slow = []
+    for key, (sec, peak, rss) in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if sec >= min_time and sec > base["time"] * threshold:
+            slow.append("%s: %.4fs (baseline %.4fs, x%.2f)" % (key, sec, base["time"], sec / base["time"]))
+        checks = [("peak", peak)]
+        if key.split("/")[0] in blender_stages:
+            checks.append(("rss", rss))
+        for name, val in checks:
+            base_val = base.get(name)
+            if base_val is None or val < min_mem:
+                continue
+            if val > max(base_val, 1) * threshold:
+                slow.append("%s: %s %.2f MB (baseline %.2f MB)" % (key, name, val / 1048576.0, base_val / 1048576.0))
+    return slow
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        prog="blender --background --factory-startup --python bbox_benchmark.py --",
+        description="Benchmark bbox.py stages and compare with stored baseline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000, 10000000],
+        help="Vertex counts of single mesh")
+    parser.add_argument("--objects", type=int, nargs="+", default=[1, 10, 100, 2000],
+        help="Object counts for BBoxButton.execute")
+    parser.add_argument("--object-size", type=int, default=1000, help="Vertex count of every object")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeats (best time is used)")
+    parser.add_argument("--baseline", default=default_baseline, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as new baseline")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Allowed slowdown against baseline")
+    parser.add_argument("--min-time", type=float, default=0.005, help="Ignore stages faster than this (seconds)")
+    parser.add_argument("--min-mem", type=float, default=1.0, help="Ignore memory below this (MB)")
+    args = parser.parse_args(argv)
+
+    bbox.register()
+    clear_scene()
+    results = {}
+    for n in args.sizes:
+        for stage, val in bench_mesh(n, args.repeat).items():
+            results["%s/%i" % (stage, n)] = val
+    for count in args.objects:
+        for stage, val in bench_objects(count, args.object_size, args.repeat).items():
+            results["%s/%ix%i" % (stage, count, args.object_size)] = val
+
+    print("%-32s %12s %14s %14s" % ("stage", "time, s", "peak mem, MB", "RSS grow, MB"))
+    for key, (sec, peak, rss) in results.items():
+        print("%-32s %12.5f %14.2f %14.2f" % (key, sec, peak / 1048576.0, rss / 1048576.0))
+    try:
+        import resource
+        print("Process peak RSS: %.1f MB" % (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0))
+    except ImportError:
+        pass
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"blender": bpy.app.version_string,
+                "stages": {key: {"time": sec, "peak": peak, "rss": rss} for key, (sec, peak, rss) in results.items()}}, f, indent=2)
+        print("[BBOX] Baseline written: %s" % args.baseline)
+        return 0
+    if not os.path.isfile(args.baseline):
+        print("[BBOX] No baseline, run with --update-baseline")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    slow = compare(results, baseline["stages"], args.threshold, args.min_time, args.min_mem * 1048576.0)
+    for line in slow:
+        print("[BBOX] REGRESSION %s" % line)
+    print("[BBOX] Compared with baseline from Blender %s: %i regression(s)" % (baseline.get("blender"), len(slow)))
+    return 1 if len(slow) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
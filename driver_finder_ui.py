@@ -1,39 +1,123 @@
 import bpy
-import re
+import re, ast, operator, functools, time
+from bpy.app.handlers import persistent
 
 # Regular expressions
 re_num = re.compile('\[[-+]?\d+\]') # ["name of object"]   for  data["key"]
 re_block = re.compile('[a-zA-Z0-9_]+') # property or method    for  data.key
 
+class HierarchyIndex:
+    # Ancestors, descendants and armature of every object, built in one pass
+    # over bpy.data.objects. Cleared when objects are added, removed or reparented,
+    # rebuilt on next request
+    def __init__(self):
+        self.ancestors = None # {object pointer: frozenset of ancestor pointers}
+        self.parents = {} # {object pointer: parent pointer or 0}
+        self.count = 0
+        self.armatures = {} # {object pointer: armature object or None}
+        self.children = {} # {object pointer: list of all descendants}
+        self.version = 0
+    
+    def clear(self):
+        self.ancestors = None
+    
+    def check(self, depsgraph):
+        # Clear if object count or parent of some updated object is changed
+        if self.ancestors is None:
+            return
+        if len(bpy.data.objects) != self.count:
+            self.clear()
+            return
+        for update in depsgraph.updates:
+            obj = update.id.original
+            if not isinstance(obj, bpy.types.Object):
+                continue
+            parent = obj.parent.as_pointer() if obj.parent else 0
+            if self.parents.get(obj.as_pointer()) != parent:
+                self.clear()
+                return
+    
+    def build(self):
+        old = self.ancestors
+        ancestors, armatures, children = {}, {}, {}
+        for obj in bpy.data.objects:
+            # Walk up to first known parent, then fill chain from top
+            chain = []
+            cur = obj
+            while cur is not None and cur.as_pointer() not in ancestors:
+                chain.append(cur)
+                cur = cur.parent
+            if cur is None:
+                up_anc, up_arm = frozenset(), None
+            else:
+                ptr = cur.as_pointer()
+                up_anc, up_arm = ancestors[ptr] | {ptr}, armatures[ptr]
+            for c in reversed(chain):
+                ptr = c.as_pointer()
+                ancestors[ptr] = up_anc
+                armatures[ptr] = c if c.type == "ARMATURE" else up_arm
+                for a in up_anc:
+                    children.setdefault(a, []).append(c)
+                up_anc, up_arm = up_anc | {ptr}, armatures[ptr]
+        self.ancestors, self.armatures, self.children = ancestors, armatures, children
+        self.parents = {o.as_pointer(): o.parent.as_pointer() if o.parent else 0 for o in bpy.data.objects}
+        self.count = len(bpy.data.objects)
+        if ancestors != old:
+            self.version += 1
+    
+    def get(self):
+        if self.ancestors is None:
+            self.build()
+        return self.ancestors
+    
+    def is_under(self, obj, p):
+        # Check p is (grand)parent of object obj
+        anc = self.get().get(obj.as_pointer())
+        if anc is None:
+            # Not in bpy.data.objects (evaluated copy or so)
+            while obj.parent is not None:
+                if obj.parent == p:
+                    return True
+                obj = obj.parent
+            return False
+        return p.as_pointer() in anc
+    
+    def armature(self, obj):
+        # Get armature of object (itself or nearest parent)
+        ptr = obj.as_pointer()
+        if ptr not in self.get():
+            while obj is not None and obj.type != "ARMATURE":
+                obj = obj.parent
+            return obj
+        return self.armatures[ptr]
+    
+    def descendants(self, p):
+        self.get()
+        return self.children.get(p.as_pointer(), [])
+
+hierarchy = HierarchyIndex()
+
 def is_parent_rec(obj, p, allow_self=False):
     # Check the p is parent of obj. obj->obj2->obj3->p
     #print(obj, type(obj))
     if allow_self and obj == p:
         return True
-    elif type(obj) not in (bpy.types.Armature, bpy.types.Key):
-        if obj.parent is None:
-            return False
-        elif obj.parent == p:
+    elif isinstance(obj, bpy.types.Object):
+        return isinstance(p, bpy.types.Object) and hierarchy.is_under(obj, p)
+    elif type(obj) not in (bpy.types.Armature, bpy.types.Key) and getattr(obj, "parent", None) is not None:
+        # Bones and so on
+        if obj.parent == p:
             return True
         return is_parent_rec(obj.parent, p)
     return False
 
 def get_all_child_obj(p):
     # Get all childrens of p
-    childs = []
-    for collection in bpy.data.collections:
-        for obj in collection.all_objects:
-            if is_parent_rec(obj, p):
-                childs.append(obj)
-    return childs
+    return list(hierarchy.descendants(p))
 
 def get_armature(obj):
     # Get armature of current object (mesh or something)
-    if obj.type == "ARMATURE":
-        return obj
-    if obj.parent is None:
-        return None
-    return get_armature(obj.parent)
+    return hierarchy.armature(obj)
 
 def get_stuff(context):
     obj_data = None
@@ -119,67 +203,88 @@ def get_obj(name):
             return obj
     return None
 
-def test_prop(obj, blocks):
-    val = ""
-    if type(blocks[-1]) is int:
-        val = "obj%s%s%s[%i]" %(
-            "".join(blocks[:-2]),
-            "" if blocks[-2][0] in ("[", ".") else ".",
-            blocks[-2],
-            blocks[-1]
-        )
-    else:
-        val = "obj%s%s%s" %(
-            "".join(blocks[:-1]),
-            "" if blocks[-1][0] in ("[", ".") else ".",
-            blocks[-1]
-        )
+def compile_blocks(blocks):
+    # Compile blocks from get_sub_blocks to accessor steps (once per blocks).
+    # Returns (steps, count of steps to owner, property name, index) for layout.prop
+    # or None if blocks are invalid
+    return _compile_blocks(tuple(blocks))
+
+@functools.lru_cache(maxsize=None)
+def _compile_blocks(blocks):
+    if len(blocks) == 0:
+        return None
+    steps = []
     try:
-        eval(val)
-        return True
-    except Exception as e:
-        #print(obj, blocks, "\n",e, "\n", val)
-        return False
+        for block in blocks:
+            if type(block) is int:
+                steps.append((operator.getitem, block))
+            elif block[0] == ".":
+                steps.append((getattr, block[1:]))
+            else:
+                steps.append((operator.getitem, ast.literal_eval(block[1:-1])))
+    except (ValueError, SyntaxError):
+        return None
+    index = -1
+    prop = blocks[-1]
+    if type(prop) is int and len(blocks) > 1:
+        index = prop
+        prop = blocks[-2]
+    if type(prop) is int:
+        prop = None
+    elif prop[0] == ".":
+        prop = prop[1:]
+    return tuple(steps), len(steps) - (1 if index < 0 else 2), prop, index
 
-def get_prop_type(obj, blocks):
-    val = ""
-    if type(blocks[-1]) is int:
-        val = "obj%s%s%s[%i]" %(
-            "".join(blocks[:-2]),
-            "" if blocks[-2][0] in ("[", ".") else ".",
-            blocks[-2],
-            blocks[-1]
-        )
-    else:
-        val = "obj%s%s%s" %(
-            "".join(blocks[:-1]),
-            "" if blocks[-1][0] in ("[", ".") else ".",
-            blocks[-1]
-        )
-    if test_prop(obj, blocks):
-        return type(eval(val))
-    else:
+@functools.lru_cache(maxsize=None)
+def compile_path(data_path):
+    # Compile driver data_path (see compile_blocks)
+    return _compile_blocks(tuple(get_sub_blocks(data_path)))
+
+def resolve_compiled(obj, compiled):
+    # Walk compiled path once. Returns (value, type, owner, prop, index) or None if path is broken
+    if compiled is None:
         return None
+    steps, n_owner, prop, index = compiled
+    owner = obj
+    val = obj
+    try:
+        for i, (op, key) in enumerate(steps):
+            if i == n_owner:
+                owner = val
+            val = op(val, key)
+    except Exception:
+        return None
+    return val, type(val), owner, prop, index
 
-def get_prop_from_obj(index, layout, obj, blocks):
-    # Def draw layout.prop for driver
+def resolve_path(obj, data_path):
+    # Resolve driver data_path on obj (see resolve_compiled)
+    return resolve_compiled(obj, compile_path(data_path))
+
+def test_prop(obj, blocks):
+    return resolve_compiled(obj, compile_blocks(blocks)) is not None
+
+def get_prop_type(obj, blocks):
+    res = resolve_compiled(obj, compile_blocks(blocks))
+    return None if res is None else res[1]
+
+def draw_prop(layout, res):
+    # Def draw layout.prop for resolved driver target
     try:
-        if type(blocks[-1]) == int:
-            if blocks[-2][0] == ".":
-                blocks[-2] = blocks[-2][1:]
-            layout.prop(
-                eval("obj" + "".join(blocks[:-2])), blocks[-2],
-                index=blocks[-1], text= "")
-            return
-        elif blocks[-1].startswith("."):
-            blocks[-1] = blocks[-1][1:]
-        layout.prop(
-            eval("obj" + "".join(blocks[:-1])), blocks[-1],
-            text= "")
+        value, prop_type, owner, prop, index = res
+        if prop is None:
+            raise ValueError("Can't draw property with path ending by index")
+        layout.prop(owner, prop, index=index, text= "")
         return None
     except Exception as e:
         return e
 
+def get_prop_from_obj(index, layout, obj, blocks):
+    # Def draw layout.prop for driver
+    res = resolve_compiled(obj, compile_blocks(blocks))
+    if res is None:
+        return ValueError("Invalid path: %s" % "".join(str(b) for b in blocks))
+    return draw_prop(layout, res)
+
 
 def get_sub_blocks(data):
     # Split drivers data_path from a.b["c"][d] to list(a,b,'["c"]','[d]')
@@ -225,38 +330,235 @@ def get_drivers_by_space(fcurves):
                     drivers.append((target.id, target.data_path, d.replace("'",'"')))
     return drivers
 
+def get_id_groups():
+    # Collections of bpy.data with drivers
+    data = bpy.data
+    return (data.actions, data.armatures, data.cache_files, data.cameras,
+            data.curves, data.fonts, data.grease_pencils, data.hair_curves,
+            data.lattices, data.libraries, data.lightprobes, data.lights,
+            data.linestyles, data.masks, data.materials, data.meshes, data.metaballs,
+            data.movieclips, data.node_groups, data.objects, data.paint_curves,
+            data.particles, data.pointclouds, data.scenes, data.shape_keys,
+            data.sounds, data.speakers, data.textures, data.volumes,
+            data.worlds)
+
+def get_id_drivers(group):
+    # Get all drivers of one ID datablock (with its material node tree)
+    drivers = []
+    if isinstance(group, bpy.types.Action):
+        drivers.extend(get_drivers_by_space(group.fcurves))
+        for gr in group.groups:
+            drivers.extend(get_drivers_by_space(gr.channels))
+        return drivers
+    if isinstance(group, bpy.types.Material):
+        if group.use_nodes and group.node_tree and group.node_tree.animation_data:
+            drivers.extend(get_drivers_by_space(group.node_tree.animation_data.drivers))
+    anim = getattr(group, "animation_data", None)
+    if anim:
+        drivers.extend(get_drivers_by_space(anim.drivers))
+        if anim.nla_tracks:
+            for track in anim.nla_tracks:
+                for strip in track.strips:
+                    drivers.extend(get_drivers_by_space(strip.fcurves))
+    return drivers
+
 def get_ALL_drivers():
+    # Full rescan of all drivers (see driver_index for cached drivers)
     drivers = []
-    data = bpy.data
-    for groups in (data.actions, data.armatures, data.cache_files, data.cameras,
-                   data.curves, data.fonts, data.grease_pencils, data.hair_curves,
-                   data.lattices, data.libraries, data.lightprobes, data.lights,
-                   data.linestyles, data.masks, data.materials, data.meshes, data.metaballs,
-                   data.movieclips, data.node_groups, data.objects, data.paint_curves,
-                   data.particles, data.pointclouds, data.scenes, data.shape_keys,
-                   data.sounds, data.speakers, data.textures, data.volumes,
-                   data.worlds):
+    for groups in get_id_groups():
         for group in groups:
-            if groups == data.actions:
-                drivers.extend(get_drivers_by_space(group.fcurves))
-                for gr in group.groups:
-                    drivers.extend(get_drivers_by_space(gr.channels))
-            elif groups == data.materials:
-                if group.use_nodes and group.node_tree.animation_data:
-                    drivers.extend(get_drivers_by_space(group.node_tree.animation_data.drivers))
-            if groups not in (data.actions, data.fonts, data.libraries) and group.animation_data:
-                drivers.extend(get_drivers_by_space(group.animation_data.drivers))
-                if group.animation_data.nla_tracks:
-                    for track in group.animation_data.nla_tracks:
-                        for strip in track.strips:
-                            drivers.extend(get_drivers_by_space(strip.fcurves))
-                            
+            drivers.extend(get_id_drivers(group))
     drivers = remove_dupes(drivers)
     drivers.sort(key=drv_sort)
     return drivers
 
+def is_valid_id(id):
+    # Check python object of ID is not removed
+    try:
+        id.name
+        return True
+    except ReferenceError:
+        return False
+
+def driver_path(driver):
+    # Full path of driver target, quoted as driven paths
+    return (repr(driver[0]) + ("" if driver[1][0] == "[" else ".") + driver[1]).replace("'",'"')
+
+def get_id_signature(id):
+    # Cheap signature of ID drivers (counts and action), drivers are rescanned only if it is changed
+    if isinstance(id, bpy.types.Action):
+        return (len(id.fcurves), len(id.groups))
+    anim = getattr(id, "animation_data", None)
+    sig = None
+    if anim:
+        sig = (len(anim.drivers), anim.action.as_pointer() if anim.action else 0,
+               sum(len(track.strips) for track in anim.nla_tracks))
+    if isinstance(id, bpy.types.Material) and id.node_tree and id.node_tree.animation_data:
+        sig = (sig, len(id.node_tree.animation_data.drivers))
+    return sig
+
+class DriverIndex:
+    # Drivers (target id, target path, driven path) per ID datablock.
+    # Full scan is done once, then only IDs updated in depsgraph with changed
+    # signature (see get_id_signature) are rescanned. Edits of targets and
+    # variables don't change signature, they force rescan through msgbus
+    def __init__(self):
+        self.ids = {} # {ID pointer: (ID, drivers)}
+        self.sigs = {} # {ID pointer: signature}
+        self.owners = {} # {embedded node tree pointer: material}
+        self.dirty = {} # {ID pointer: ID}
+        self.targets = [] # Target IDs of drivers
+        self.full = True
+        self.forced = False # Rescan next dirty IDs regardless of signature
+        self.version = 0
+        self.drivers = []
+        self.paths = set() # Normalized target and driven paths
+    
+    def clear(self):
+        # Full rescan on next request
+        self.ids.clear()
+        self.sigs.clear()
+        self.owners.clear()
+        self.dirty.clear()
+        self.full = True
+        self.forced = False
+    
+    def force(self):
+        # Driver targets or variables are edited
+        self.forced = True
+    
+    def mark_dirty(self, id):
+        # Rescan ID (or material of its node tree) on next request
+        ptr = id.as_pointer()
+        owner = self.owners.get(ptr)
+        if owner is not None:
+            id, ptr = owner, owner.as_pointer()
+        self.dirty[ptr] = id
+    
+    def add(self, id, sig=None):
+        # Scan ID, return True if its drivers are changed
+        ptr = id.as_pointer()
+        self.sigs[ptr] = get_id_signature(id) if sig is None else sig
+        drivers = get_id_drivers(id)
+        if isinstance(id, bpy.types.Material) and id.node_tree is not None:
+            self.owners[id.node_tree.as_pointer()] = id
+        old = self.ids.get(ptr)
+        if len(drivers) == 0:
+            self.ids.pop(ptr, None)
+            return old is not None
+        self.ids[ptr] = (id, drivers)
+        return old is None or old[1] != drivers
+    
+    def prune(self):
+        # Drop removed IDs, return True if some ID or target is removed
+        changed = False
+        for ptr, (id, drivers) in list(self.ids.items()):
+            if not is_valid_id(id):
+                del self.ids[ptr]
+                self.sigs.pop(ptr, None)
+                changed = True
+        return changed or not all(is_valid_id(id) for id in self.targets)
+    
+    def update(self):
+        # Rescan dirty IDs, rebuild flat list if something is changed
+        changed = False
+        if self.full:
+            self.full = False
+            self.dirty.clear()
+            for groups in get_id_groups():
+                for group in groups:
+                    self.add(group)
+            changed = True
+        elif len(self.dirty) > 0:
+            dirty = list(self.dirty.values())
+            self.dirty.clear()
+            forced, self.forced = self.forced, False
+            for id in dirty:
+                if not is_valid_id(id):
+                    continue
+                sig = get_id_signature(id)
+                ptr = id.as_pointer()
+                same = (self.sigs[ptr] == sig) if ptr in self.sigs else (sig is None)
+                if same and not forced:
+                    # Transform, geometry and so on, drivers are the same
+                    continue
+                changed = self.add(id, sig) or changed
+            # Removed IDs don't have updates themselves
+            changed = self.prune() or changed
+        if changed:
+            drivers = remove_dupes([drv for id, drvs in self.ids.values() for drv in drvs if is_valid_id(drv[0])])
+            drivers.sort(key=drv_sort)
+            self.drivers = drivers
+            self.targets = list({drv[0].as_pointer(): drv[0] for drv in drivers}.values())
+            self.paths = set(driver_path(drv) for drv in drivers)
+            self.paths.update(drv[2] for drv in drivers)
+            self.version += 1
+        return self.drivers
+
 cached_blocks = {}
 cached_drivers = []
+driver_index = DriverIndex()
+
+def get_cached_drivers():
+    # Get sorted list of all drivers from driver index
+    global cached_drivers
+    cached_drivers = driver_index.update()
+    return cached_drivers
+
+@persistent
+def dfui_depsgraph_update(scene, depsgraph):
+    # Mark updated IDs for rescanning
+    if depsgraph.id_type_updated('OBJECT'):
+        hierarchy.check(depsgraph)
+    if driver_index.full:
+        return
+    for update in depsgraph.updates:
+        driver_index.mark_dirty(update.id.original)
+
+msgbus_key = "dfui_msgbus_owner" # Key of msgbus owner in bpy.app.driver_namespace
+msgbus_keys = (
+    (bpy.types.DriverTarget, "id"),
+    (bpy.types.DriverTarget, "id_type"),
+    (bpy.types.DriverTarget, "data_path"),
+    (bpy.types.DriverTarget, "bone_target"),
+    (bpy.types.DriverVariable, "type"),
+    (bpy.types.DriverVariable, "name"),
+    (bpy.types.Driver, "variables"),
+    )
+
+def dfui_driver_edited(*args):
+    driver_index.force()
+
+def subscribe_msgbus():
+    # Owner is kept in driver namespace, so subscriptions of previous runs of script are cleared too
+    owner = bpy.app.driver_namespace.setdefault(msgbus_key, object())
+    bpy.msgbus.clear_by_owner(owner)
+    for key in msgbus_keys:
+        bpy.msgbus.subscribe_rna(key=key, owner=owner, args=(), notify=dfui_driver_edited)
+
+def unsubscribe_msgbus():
+    owner = bpy.app.driver_namespace.pop(msgbus_key, None)
+    if owner is not None:
+        bpy.msgbus.clear_by_owner(owner)
+
+@persistent
+def dfui_undo_post(*args):
+    # Undo/redo replaces all IDs
+    driver_index.clear()
+    hierarchy.clear()
+    useless_scan["generation"] += 1
+
+@persistent
+def dfui_load_post(*args):
+    driver_index.clear()
+    hierarchy.clear()
+    useless_results.clear()
+    useless_scan["running"] = False
+    useless_scan["generation"] += 1
+    cached_blocks.clear()
+    cached_drivers.clear()
+    # File load clears all msgbus subscriptions
+    subscribe_msgbus()
 
 class DriverFinderUIPropertyGroup(bpy.types.PropertyGroup):
     show_from_all : bpy.props.BoolProperty(
@@ -291,6 +593,17 @@ class DriverFinderUIPropertyGroup(bpy.types.PropertyGroup):
         name="Others",
         default=True
         )
+    rows_per_page : bpy.props.IntProperty(
+        name="Per page",
+        default=50,
+        min=0,
+        description="Drivers per page (0 - all)"
+        )
+    rows_page : bpy.props.IntProperty(
+        name="Page",
+        default=1,
+        min=1
+        )
     # Globals
     prop_scene : bpy.props.BoolProperty(
         name="Scene",
@@ -342,7 +655,7 @@ class OPERATOR_Dump_Drivers_ALL(bpy.types.Operator):
             _obj = context.active_object
         obj = _obj.data
         
-        drivers = get_ALL_drivers()
+        drivers = get_cached_drivers()
         curr_obj = ""
         box = None
         obj_path = ""
@@ -389,7 +702,7 @@ class OPERATOR_Dump_Drivers(bpy.types.Operator):
             _obj = context.active_object
         obj = _obj.data
         
-        drivers = get_ALL_drivers()
+        drivers = get_cached_drivers()
         curr_obj = ""
         box = None
         obj_path = ""
@@ -433,14 +746,76 @@ class OPERATOR_Clear_cached_blocks(bpy.types.Operator):
         return True
 
     def execute(self, context):
+        global rig_rows_key
         cached_blocks.clear() 
         cached_drivers.clear()
+        driver_index.clear()
+        hierarchy.clear()
+        useless_results.clear()
+        rig_rows_key = None
         return {'FINISHED'}
 
 
 def drv_sort(e):
     return e[0].name + "  " + e[1] + "  " + e[2]
 
+# Rows of EasyRigChecker: (target name, number, driven path, target path, target ID, compiled path).
+# Rebuilt only if driver index, hierarchy, "From ALL objects" or active object are changed.
+# Paths are resolved in draw (targets can be removed without driver changes)
+rig_rows = []
+rig_rows_key = None
+rig_filter_props = ("show_broken", "show_valid", "show_int",
+                    "show_float", "show_bool", "show_str", "show_others")
+
+def get_rig_rows(context):
+    global rig_rows, rig_rows_key
+    dfui_props = context.scene.dfui_props
+    drivers = get_cached_drivers()
+    active = context.active_object
+    hierarchy.get()
+    key = (driver_index.version, hierarchy.version, active.as_pointer() if active else 0,
+           dfui_props.show_from_all)
+    if key == rig_rows_key:
+        return rig_rows
+    _obj = get_armature(active) if active else None
+    if _obj is None:
+        _obj = active
+    obj = _obj.data if _obj else None
+    rows = []
+    curr_obj = ""
+    n = 1
+    for driver_name in drivers:
+        if not dfui_props.show_from_all and not (is_parent_rec(driver_name[0], obj, True) or is_parent_rec(driver_name[0], _obj, True)):
+            continue
+        if curr_obj != driver_name[0].name:
+            curr_obj = driver_name[0].name
+            n = 1
+        rows.append((curr_obj, n, driver_name[2],
+            "%s%s%s" % (curr_obj, "" if driver_name[1][0] == "[" else ".", driver_name[1]),
+            driver_name[0], compile_path(driver_name[1])))
+        n += 1
+    rig_rows = rows
+    rig_rows_key = key
+    return rig_rows
+
+def is_rig_row_shown(dfui_props, res):
+    # Apply show_* filters to resolved target
+    if res is not None:
+        if not dfui_props.show_valid:
+            return False
+    elif not dfui_props.show_broken:
+        return False
+    prop_type = None if res is None else res[1]
+    if prop_type == int:
+        return dfui_props.show_int
+    elif prop_type == float:
+        return dfui_props.show_float
+    elif prop_type == bool:
+        return dfui_props.show_bool
+    elif prop_type == str:
+        return dfui_props.show_str
+    return dfui_props.show_others
+
 class EasyRigChecker(bpy.types.Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -458,11 +833,6 @@ class EasyRigChecker(bpy.types.Panel):
             return False
 
     def draw(self, context):
-        obj_data, pose_bones = get_stuff(context)
-        _obj = get_armature(context.active_object)
-        if _obj is None:
-            _obj = context.active_object
-        obj = _obj.data
         dfui_props = bpy.context.scene.dfui_props
         
         layout = self.layout
@@ -482,67 +852,205 @@ class EasyRigChecker(bpy.types.Panel):
         row.operator(OPERATOR_Dump_Drivers.bl_idname)
         row.operator(OPERATOR_Dump_Drivers_ALL.bl_idname)
         col = col_root.box().column()
-        global cached_drivers
-        if len(cached_drivers) == 0:
-            cached_drivers = get_ALL_drivers()
-        col.row().label(text="-- Drivers (%i) --" % (len(cached_drivers)))
-        #drivers = remove_dupes(drivers)
-        #drivers.sort(key=drv_sort)
+        rows = get_rig_rows(context)
+        per_page = dfui_props.rows_per_page
+        filtered = not all(getattr(dfui_props, name) for name in rig_filter_props)
+        if filtered:
+            rows = [(row, res) for row in rows
+                for res in (resolve_compiled(row[4], row[5]),) if is_rig_row_shown(dfui_props, res)]
+        shown = len(rows)
+        pages = (shown - 1) // per_page + 1 if per_page > 0 and shown > per_page else 1
+        if pages > 1:
+            start = (min(dfui_props.rows_page, pages) - 1) * per_page
+            rows = rows[start:start + per_page]
+        if not filtered:
+            # Nothing is filtered, only rows of page are resolved
+            rows = [(row, resolve_compiled(row[4], row[5])) for row in rows]
+        col.row().label(text="-- Drivers (%i of %i) --" % (shown, len(cached_drivers)))
+        # Paging
+        row = col.row()
+        row.prop(dfui_props, "rows_per_page")
+        if pages > 1:
+            row.prop(dfui_props, "rows_page")
+            row.label(text="of %i" % (pages))
         curr_obj = ""
         box = None
-        n = 1
-        for driver_name in cached_drivers:
-            if not dfui_props.show_from_all and not (is_parent_rec(driver_name[0], obj, True) or is_parent_rec(driver_name[0], _obj, True)):
-                continue
-            if curr_obj != driver_name[0].name:
+        for (name, n, driven, path, target, compiled), res in rows:
+            if curr_obj != name:
                 box = col.box()
-                curr_obj = driver_name[0].name
-                n = 1
-            key = "%i %s %s %s" % (n, driver_name[0].name, driver_name[1], driver_name[2])
-            if cached_blocks.get(key) is None:
-                cached_blocks[key] = get_sub_blocks(driver_name[1])
-            if test_prop(driver_name[0], cached_blocks[key]):
-                if not dfui_props.show_valid:
-                    continue
-            elif not dfui_props.show_broken:
-                continue
-            prop_type = get_prop_type(driver_name[0], cached_blocks[key])
-            if prop_type == int and not dfui_props.show_int:
-                continue
-            elif prop_type == float and not dfui_props.show_float:
-                continue
-            elif prop_type == bool and not dfui_props.show_bool:
-                continue
-            elif prop_type == str and not dfui_props.show_str:
-                continue
-            elif prop_type not in (int, float, bool, str) and not dfui_props.show_others:
-                continue
+                curr_obj = name
             _box = box.box()
-            _box.row().label(text="%i  %s" % (n, driver_name[2]))
-            _box.row().label(text="%s%s%s" % (driver_name[0].name, "" if driver_name[1][0] == "[" else ".", driver_name[1]))
-            res = get_prop_from_obj(n, _box.row(), driver_name[0], cached_blocks[key])
-            if res is not None:
-                box.row().label(text="    %s" % (res))
-            n += 1
+            _box.row().label(text="%i  %s" % (n, driven))
+            _box.row().label(text=path)
+            if res is None:
+                box.row().label(text="    Invalid path")
+            else:
+                err = draw_prop(_box.row(), res)
+                if err is not None:
+                    box.row().label(text="    %s" % (err))
         col.row().label(text="-- END --")
         
 
 def prop_is_useless(path):
-    global cached_drivers
-    if len(cached_drivers) == 0:
-        cached_drivers = get_ALL_drivers()
-    for driver in cached_drivers:
-        p1 = repr(driver[0])
-        if driver[1][0] != "[":
-            p1 += "."
-        p1 += driver[1]
-        p1 = p1.replace("'",'"')
-        if p1 == path or driver[2] == path:
-            return False
-    return True
+    get_cached_drivers()
+    return path not in driver_index.paths
 
 
     
+# Results of useless props scan: {owner pointer: (label, name, repr, keys, driver index version, [(prop, path)])}.
+# Owners with same keys and same drivers are not checked again
+useless_results = {}
+# generation is bumped by undo/redo and file load, running scans stop on change
+useless_scan = {"running": False, "done": 0, "total": 0, "generation": 0}
+
+def get_useless_items(dfui_props):
+    # Get (label, owner ID, bone name) of custom props to check. Bones are stored
+    # by name (wrappers of non-ID data are not safe after removal)
+    items = []
+    if dfui_props.prop_world:
+        items.extend(("Worlds:", o, None) for o in bpy.data.worlds)
+    if dfui_props.prop_scene:
+        items.extend(("Scenes:", o, None) for o in bpy.data.scenes)
+    if dfui_props.prop_collections:
+        items.extend(("Collections:", o, None) for o in bpy.data.collections)
+    if dfui_props.prop_objects:
+        items.extend(("Objects:", o, None) for o in bpy.data.objects)
+    if dfui_props.prop_mats:
+        items.extend(("Materials:", o, None) for o in bpy.data.materials)
+    if dfui_props.prop_data:
+        items.extend(("Objects Data:", o.data, None) for o in bpy.data.objects if o.data is not None)
+    if dfui_props.prop_bones:
+        for arm in bpy.data.armatures:
+            items.extend(("Bones:", arm, bone.name) for bone in arm.bones)
+    if dfui_props.prop_posebones:
+        for obj in bpy.data.objects:
+            if obj.type != 'ARMATURE':
+                continue
+            items.extend(("PoseBones:", obj, bone.name) for bone in obj.pose.bones)
+    return items
+
+def get_useless_owner(id, bone):
+    # Get owner of custom props from item of get_useless_items or None if it is removed
+    if bone is None:
+        return id
+    elif isinstance(id, bpy.types.Armature):
+        return id.bones.get(bone)
+    return id.pose.bones.get(bone) if id.pose else None
+
+def scan_useless_item(label, obj):
+    # Check custom props of one owner, skip if its keys and drivers are not changed
+    ptr = obj.as_pointer()
+    keys = tuple(obj.keys())
+    res = useless_results.get(ptr)
+    if res is not None and res[3] == keys and res[4] == driver_index.version:
+        return ptr
+    obj_repr = repr(obj)
+    props = []
+    for prop in keys:
+        path = (obj_repr+"['"+prop+"']").replace("'",'"')
+        if prop_is_useless(path):
+            props.append((prop, path))
+    useless_results[ptr] = (label, obj.name, obj_repr, keys, driver_index.version, props)
+    return ptr
+
+def tag_redraw_view3d(context):
+    for area in context.screen.areas if context.screen else ():
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+class OPERATOR_Scan_UselessProps(bpy.types.Operator):
+    """Find custom props without drivers in background (Esc to cancel)"""
+    bl_idname = "object.scan_useless_props"
+    bl_label = "Scan"
+    
+    time_slice = 0.02 # Seconds of work per timer event
+    
+    @classmethod
+    def poll(cls, context):
+        return not useless_scan["running"]
+    
+    def invoke(self, context, event):
+        get_cached_drivers()
+        self.items = get_useless_items(context.scene.dfui_props)
+        self.visited = []
+        useless_scan.update(running=True, done=0, total=len(self.items))
+        self.generation = useless_scan["generation"]
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        # Without modal: scan at once
+        get_cached_drivers()
+        self.items = get_useless_items(context.scene.dfui_props)
+        self.visited = []
+        for label, id, bone in self.items:
+            obj = get_useless_owner(id, bone)
+            if obj is not None:
+                self.visited.append(scan_useless_item(label, obj))
+        self.finish(context)
+        return {'FINISHED'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC' or self.generation != useless_scan["generation"]:
+            # Cancelled by user, or IDs of items are replaced by undo/load
+            self.stop(context)
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        try:
+            i = self.scan_slice()
+        except Exception:
+            self.stop(context)
+            raise
+        useless_scan["done"] = i
+        tag_redraw_view3d(context)
+        if i < len(self.items):
+            return {'RUNNING_MODAL'}
+        self.stop(context)
+        self.finish(context)
+        return {'FINISHED'}
+    
+    def scan_slice(self):
+        # Scan items for time_slice seconds, return index of next item
+        get_cached_drivers()
+        start = time.perf_counter()
+        i = useless_scan["done"]
+        while i < len(self.items) and time.perf_counter() - start < self.time_slice:
+            label, id, bone = self.items[i]
+            i += 1
+            if not is_valid_id(id):
+                # ID is removed during scan
+                continue
+            try:
+                # Owners are resolved again on every tick
+                obj = get_useless_owner(id, bone)
+                if obj is not None:
+                    self.visited.append(scan_useless_item(label, obj))
+            except ReferenceError:
+                continue
+        return i
+    
+    def cancel(self, context):
+        # Called by window manager (file loading, window closing)
+        self.stop(context)
+    
+    def stop(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        useless_scan["running"] = False
+        tag_redraw_view3d(context)
+    
+    def finish(self, context):
+        # Keep only scanned owners in scan order
+        res = {ptr: useless_results[ptr] for ptr in self.visited if ptr in useless_results}
+        useless_results.clear()
+        useless_results.update(res)
+        self.report({'INFO'}, "Useless props: %i" % (sum(len(r[5]) for r in res.values())))
+    
+    
 def get_DEL_items(self, context):
     items = (
         ("PROP","Property","One Prop"),
@@ -580,6 +1088,10 @@ class DELETE_UselessProp(bpy.types.Operator):
                     path = (repr(obj)+"['"+prop+"']").replace("'",'"')
                     if prop_is_useless(path):
                         eval(self.obj+'.pop("'+prop+'")')
+        for ptr, res in useless_results.items():
+            if res[2] == self.obj:
+                scan_useless_item(res[0], obj)
+                break
         return {'FINISHED'}
 
 class UselessPropChecker(bpy.types.Panel):
@@ -617,68 +1129,38 @@ class UselessPropChecker(bpy.types.Panel):
         row.prop(dfui_props, "prop_posebones")
         row = col_root.row()
         row.prop(dfui_props, "prop_mats")
-        colls = []
-        if dfui_props.prop_world:
-            colls.append(("Worlds:", bpy.data.worlds))
-        if dfui_props.prop_scene:
-            colls.append(("Scenes:", bpy.data.scenes))
-        if dfui_props.prop_collections:
-            colls.append(("Collections:", bpy.data.collections))
-        if dfui_props.prop_objects:
-            colls.append(("Objects:", bpy.data.objects))
-        if dfui_props.prop_mats:
-            colls.append(("Materials:", bpy.data.materials))
-        if dfui_props.prop_data:
-            objs = []
-            for obj in bpy.data.objects:
-                objs.append(obj.data)
-            colls.append(("Objects Data:", objs))
-        if dfui_props.prop_bones:
-            objs = []
-            for obj in bpy.data.armatures:
-                for bone in obj.bones:
-                    objs.append(bone)
-            colls.append(("Bones:", objs))
-        if dfui_props.prop_posebones:
-            objs = []
-            for obj in bpy.data.objects:
-                if obj.type != 'ARMATURE':
-                    continue
-                for bone in obj.pose.bones:
-                    objs.append(bone)
-            colls.append(("Bones:", objs))
+        row = col_root.row()
+        row.operator(OPERATOR_Scan_UselessProps.bl_idname)
+        if useless_scan["running"]:
+            row.label(text="Scanning: %i / %i" % (useless_scan["done"], useless_scan["total"]))
         
         main_row = col_root.row()
         buf_num = 0
-        for lbl, coll in colls:
-            c_box = None
-            for obj in coll:
-                o_box = None
-                _wbox = None
-                for prop in obj.keys():
-                    path = (repr(obj)+"['"+prop+"']").replace("'",'"')
-                    if prop_is_useless(path):
-                        if c_box is None:
-                            c_box = col_root.box()
-                            c_box.label(text=lbl)
-                        if o_box is None:
-                            o_box = c_box.box()
-                            o_row = o_box.row()
-                            splitter = o_row.split(factor=0.8)
-                            splitter.label(text=obj.name)
-                            _op = splitter.operator(DELETE_UselessProp.bl_idname)
-                            _op.obj = repr(obj)
-                            _op.group = 'OBJECT'
-                        if _wbox is None:
-                            _wbox = o_box.box()
-                        _wrow = _wbox.row()
-                        splitter = _wbox.split(factor=0.8)
-                        splitter.label(text=path)
-                        op = splitter.operator(DELETE_UselessProp.bl_idname)
-                        op.obj = repr(obj)
-                        op.prop = prop
-                        op.group = 'PROP'
-                        buf_num += 1
+        c_box = None
+        lbl = None
+        for label, name, obj_repr, keys, version, props in useless_results.values():
+            if len(props) == 0:
+                continue
+            if lbl != label:
+                lbl = label
+                c_box = col_root.box()
+                c_box.label(text=lbl)
+            o_box = c_box.box()
+            o_row = o_box.row()
+            splitter = o_row.split(factor=0.8)
+            splitter.label(text=name)
+            _op = splitter.operator(DELETE_UselessProp.bl_idname)
+            _op.obj = obj_repr
+            _op.group = 'OBJECT'
+            _wbox = o_box.box()
+            for prop, path in props:
+                splitter = _wbox.split(factor=0.8)
+                splitter.label(text=path)
+                op = splitter.operator(DELETE_UselessProp.bl_idname)
+                op.obj = obj_repr
+                op.prop = prop
+                op.group = 'PROP'
+                buf_num += 1
         main_row.label(text="Current useless props: %i" % (buf_num))
             
         '''
@@ -698,6 +1180,14 @@ class UselessPropChecker(bpy.types.Panel):
         '''
         
         
+def remove_handlers():
+    # Remove handlers by name, also ones left by previous runs of script
+    names = (dfui_depsgraph_update.__name__, dfui_load_post.__name__, dfui_undo_post.__name__)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post,
+                     bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        for handler in [h for h in handlers if getattr(h, "__name__", None) in names]:
+            handlers.remove(handler)
+
 def register():
     bpy.utils.register_class(DriverFinderUIPropertyGroup)
     bpy.utils.register_class(OPERATOR_Clear_cached_blocks)
@@ -706,7 +1196,14 @@ def register():
     bpy.utils.register_class(EasyRigChecker)
     bpy.utils.register_class(UselessPropChecker)
     bpy.utils.register_class(DELETE_UselessProp)
+    bpy.utils.register_class(OPERATOR_Scan_UselessProps)
     bpy.types.Scene.dfui_props = bpy.props.PointerProperty(type=DriverFinderUIPropertyGroup)
+    remove_handlers()
+    bpy.app.handlers.depsgraph_update_post.append(dfui_depsgraph_update)
+    bpy.app.handlers.load_post.append(dfui_load_post)
+    bpy.app.handlers.undo_post.append(dfui_undo_post)
+    bpy.app.handlers.redo_post.append(dfui_undo_post)
+    subscribe_msgbus()
 
 
 def unregister():
@@ -717,6 +1214,9 @@ def unregister():
     bpy.utils.unregister_class(EasyRigChecker)
     bpy.utils.unregister_class(UselessPropChecker)
     bpy.utils.unregister_class(DELETE_UselessProp)
+    bpy.utils.unregister_class(OPERATOR_Scan_UselessProps)
+    remove_handlers()
+    unsubscribe_msgbus()
 
 
 